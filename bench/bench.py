@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Benchmarks of the game's hot operations.
+
+Every benchmark reports the time per operation in microseconds. Results are
+written as JSON and compared against a stored baseline, failing when an
+operation got slower than the allowed threshold.
+
+    bench/bench.py                            # compare to the baseline
+    bench/bench.py --save-baseline            # store a new baseline
+    bench/bench.py --save-baseline snapshot   # only update a benchmark
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import bench_memory  # noqa: E402
+from src.board.board import Board  # noqa: E402
+from src.colors import colors  # noqa: E402
+from src.movement.movement import Movement  # noqa: E402
+from src.point.point import Point  # noqa: E402
+from src.randomizer.randomizer import Randomizer  # noqa: E402
+from src.runner.runner import play_game  # noqa: E402
+from src.square.square import Square  # noqa: E402
+from src.tetromino.constants import COLORS  # noqa: E402
+from src.tetromino.tetromino import Tetromino  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def timed(operation, number, setup=None, repeat=15):
+    """
+    Time an operation, excluding its setup.
+
+    Args:
+        operation (function): The operation to be timed, given the result of
+            the setup if there is one.
+        number (int): The number of operations per repetition.
+        setup (function): Builds the argument of each operation. Without a
+            setup, the operations are timed as a single loop.
+        repeat (int): The number of repetitions, of which the fastest is
+            kept.
+
+    Returns:
+        float: The time per operation in microseconds.
+
+    """
+    best = None
+    for i in range(repeat):
+        if setup is None:
+            start = time.perf_counter()
+            for j in range(number):
+                operation()
+            total = time.perf_counter() - start
+        else:
+            total = 0.0
+            for j in range(number):
+                argument = setup()
+                start = time.perf_counter()
+                operation(argument)
+                total += time.perf_counter() - start
+        if best is None or total < best:
+            best = total
+    return best / number * 1e6
+
+
+def stacked_board(lines=4, height=12):
+    """
+    Build a board with a stack of squares and filled lines at the bottom.
+
+    Args:
+        lines (int): The number of filled lines.
+        height (int): The height of the stack.
+
+    Returns:
+        Board: The board.
+
+    """
+    board = Board(10, 22, seed=1)
+    for j in range(height):
+        for i in range(10):
+            if j < lines or (i + j) % 3:
+                board.board_tetrominos_squares.append(
+                    Square(Point(i, j), colors.ASH))
+    board.update_matrices()
+    return board
+
+
+def clear(board):
+    """
+    Clear and drop the filled lines of a board.
+
+    Args:
+        board (Board): The board whose filled lines are cleared.
+    """
+    filled_indices = board.get_filled_indices()
+    board.clear_lines(filled_indices)
+    board.drop_lines(filled_indices)
+
+
+def ghost(board):
+    """
+    Recompute the ghost of a board's current tetromino.
+
+    Args:
+        board (Board): The board of the ghost.
+
+    Returns:
+        int: The ghost's distance below the current tetromino.
+
+    """
+    # a new stack version forces the ghost to be recomputed
+    board.stack_version += 1
+    return board.get_ghost_tetromino().distance
+
+
+def wall_kick_board():
+    """
+    Build a board where rotating the current tetromino clockwise needs a
+    wall kick.
+
+    Returns:
+        Movement: The movement handler of the board.
+
+    """
+    board = Board(10, 22, seed=1)
+    board.current_tetromino = Tetromino("I", Point(-2, 10), COLORS["I"])
+    board.current_tetromino.rotate_cw()
+    return Movement(board)
+
+
+def get_results(pieces):
+    """
+    Run every benchmark once.
+
+    Args:
+        pieces (int): The number of pieces of the full game benchmark.
+
+    Returns:
+        dict: The time per operation in microseconds of each benchmark.
+
+    """
+    board = stacked_board()
+    randomizer = Randomizer(1)
+    snapshot = board.snapshot()
+    results = {
+        "update_matrices": timed(board.update_matrices, 2000),
+        "get_ghost_tetromino": timed(lambda: ghost(board), 100000),
+        "clear_lines": timed(clear, 500, stacked_board),
+        "rotate_cw_wall_kick": timed(
+            Movement.rotate_cw, 5000, wall_kick_board),
+        "hard_drop": timed(
+            Movement.hard_drop, 500, lambda: Movement(stacked_board(lines=0))),
+        "randomizer_next": timed(randomizer.next, 100000),
+        "snapshot": timed(board.snapshot, 100000),
+        "restore": timed(lambda: board.restore(snapshot), 100000),
+        "game": timed(lambda: play_game(1, pieces), 3),
+    }
+    return results
+
+
+def get_best_results(pieces, runs):
+    """
+    Run every benchmark several times, keeping the fastest time of each.
+
+    Noise on a busy machine only ever makes an operation slower, so the
+    fastest of several runs varies far less than a single run.
+
+    Args:
+        pieces (int): The number of pieces of the full game benchmark.
+        runs (int): The number of runs.
+
+    Returns:
+        dict: The best time per operation in microseconds of each benchmark.
+
+    """
+    best = get_results(pieces)
+    for i in range(runs - 1):
+        for name, value in get_results(pieces).items():
+            best[name] = min(best[name], value)
+    return best
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare benchmark results against a baseline.
+
+    Args:
+        results (dict): The results of the current run.
+        baseline (dict): The results of the baseline run.
+        threshold (float): The allowed slowdown as a fraction (0.2 = 20%).
+
+    Returns:
+        list (string): The benchmarks slower than the threshold allows.
+
+    """
+    regressions = []
+    for name, value in sorted(results.items()):
+        if name not in baseline:
+            print("{:<34}{:>14.2f}{:>10}".format(name, value, "new"))
+            continue
+        change = value / baseline[name] - 1
+        print("{:<34}{:>14.2f}{:>+10.1%}".format(name, value, change))
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--output", default="bench_output.json",
+                        help="file the results are written to")
+    parser.add_argument("--baseline", default=BASELINE,
+                        help="file of the baseline results")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="allowed slowdown before failing (0.5 = 50%%)")
+    parser.add_argument("--pieces", type=int, default=100,
+                        help="number of pieces of the full game benchmark")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="number of runs the fastest time is kept of")
+    parser.add_argument("--save-baseline", nargs="*", metavar="NAME",
+                        help="store the results as the new baseline, only "
+                        "updating the named benchmarks if any are given")
+    args = parser.parse_args()
+
+    results = get_best_results(args.pieces, args.runs)
+    results.update(
+        {"memory_" + k: v for k, v in bench_memory.get_results().items()})
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.save_baseline is not None:
+        baseline = results
+        if args.save_baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+            baseline.update(
+                (name, results[name]) for name in args.save_baseline)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print("Baseline saved to {}".format(args.baseline))
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline at {}".format(args.baseline))
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print("Regressions: {}".format(", ".join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
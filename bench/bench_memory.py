@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Memory used by the game objects and allocations made while playing.
+
+Run on its own, the results are compared against the ones stored in the
+baseline by bench.py.
+"""
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from src.bot.bot import Bot  # noqa: E402
+from src.engine.engine import Engine  # noqa: E402
+from src.point.point import Point  # noqa: E402
+from src.square.square import Square  # noqa: E402
+from src.tetromino.constants import COLORS, IDS, SPAWN  # noqa: E402
+from src.tetromino.tetromino import Tetromino  # noqa: E402
+
+COUNT = 10000
+# Where bench.py stores these results, with a "memory_" prefix
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def measure(create):
+    """
+    Measure the memory used by the objects built by a function.
+
+    Args:
+        create (function): Builds and returns the objects to be measured.
+
+    Returns:
+        int: The number of bytes allocated and still in use.
+
+    """
+    tracemalloc.start()
+    objects = create()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def measure_allocations(run):
+    """
+    Count the memory blocks allocated while running a function.
+
+    Args:
+        run (function): The function to be measured.
+
+    Returns:
+        int: The number of bytes allocated at the peak.
+
+    """
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def get_results():
+    """
+    Measure the memory of the game objects.
+
+    Returns:
+        dict: The bytes used per object and the peak allocated while
+        playing.
+
+    """
+    def play():
+        engine = Engine(seed=1)
+        bot = Bot(time_budget=1)
+        for i in range(20):
+            bot.play(engine)
+
+    return {
+        "point_bytes": measure(
+            lambda: [Point(i, i) for i in range(COUNT)]) / COUNT,
+        "square_bytes": measure(
+            lambda: [Square(Point(i, i), COLORS["T"])
+                     for i in range(COUNT)]) / COUNT,
+        "tetromino_bytes": measure(
+            lambda: [Tetromino(IDS[i % 7], SPAWN[IDS[i % 7]],
+                               COLORS[IDS[i % 7]])
+                     for i in range(COUNT)]) / COUNT,
+        "bot_20_pieces_peak_bytes": measure_allocations(play),
+    }
+
+
+if __name__ == '__main__':
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+    for name, value in get_results().items():
+        before = baseline.get("memory_" + name)
+        if before is None:
+            print("{}\t{:.0f}".format(name, value))
+        else:
+            print("{}\t{:.0f}\t{:+.1%}".format(
+                name, value, value / before - 1))
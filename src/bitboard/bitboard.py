@@ -0,0 +1,333 @@
+"""Occupancy grid stored as one integer bitmask per row."""
+import logging
+from bisect import bisect_left
+
+from src.bitboard.zobrist import get_zobrist
+
+log = logging.getLogger(__name__)
+
+
+class Bitboard:
+    """
+    A bitboard keeps track of which positions of the board are filled.
+
+    Each row is stored as an integer where bit x is set when the position
+    [x][y] is filled, so that row operations become integer operations.
+    The number of filled positions of every row is tracked as well so that
+    the filled rows are known without scanning the bitboard, along with the
+    height of every column's surface for computing drop distances, and a
+    Zobrist hash of the filled positions. The bitboard
+    can also be indexed like a list of columns (``bitboard[x][y]``) for
+    compatibility with the nested list matrices.
+    """
+
+    def __init__(self, width, height):
+        """
+        Initialize a Bitboard object.
+
+        Args:
+            width (int): The bitboard's width in number of units.
+            height (int): The bitboard's height in number of units.
+        """
+        self.width = width
+        self.height = height
+        self.full_row = (1 << width) - 1
+        self.rows = [0] * height
+        self.row_counts = [0] * height
+        self.filled_rows = set()
+        self.column_heights = [0] * width
+        self.zobrist = get_zobrist(width, height)
+        self.hash = 0
+
+    def __len__(self):
+        return self.width
+
+    def __getitem__(self, x):
+        if x < 0:
+            x += self.width
+        if x < 0 or x >= self.width:
+            raise IndexError("Column index out of range: {}".format(x))
+        return _Column(self, x)
+
+    def __iter__(self):
+        for x in range(self.width):
+            yield _Column(self, x)
+
+    def is_filled(self, x, y):
+        """
+        Determine whether the given position is filled.
+
+        Args:
+            x (int): The x coordinate of the position.
+            y (int): The y coordinate of the position.
+
+        Returns:
+            bool: True if the position is filled, False otherwise.
+
+        """
+        return (self.rows[y] >> x) & 1 == 1
+
+    def fill(self, x, y):
+        """
+        Fill the given position.
+
+        Args:
+            x (int): The x coordinate of the position to be filled.
+            y (int): The y coordinate of the position to be filled.
+        """
+        bit = 1 << x
+        if self.rows[y] & bit:
+            return
+        self.rows[y] |= bit
+        self.row_counts[y] += 1
+        self.hash ^= self.zobrist.cells[y][x]
+        if self.row_counts[y] == self.width:
+            self.filled_rows.add(y)
+        if self.column_heights[x] <= y:
+            self.column_heights[x] = y + 1
+
+    def unfill(self, x, y):
+        """
+        Unfill the given position.
+
+        Args:
+            x (int): The x coordinate of the position to be unfilled.
+            y (int): The y coordinate of the position to be unfilled.
+        """
+        bit = 1 << x
+        if not self.rows[y] & bit:
+            return
+        self.rows[y] &= ~bit
+        self.row_counts[y] -= 1
+        self.hash ^= self.zobrist.cells[y][x]
+        self.filled_rows.discard(y)
+        if self.column_heights[x] == y + 1:
+            self.update_column_heights(bit, y)
+
+    def clear(self):
+        """Unfill every position of the bitboard."""
+        self.rows = [0] * self.height
+        self.row_counts = [0] * self.height
+        self.filled_rows = set()
+        self.column_heights = [0] * self.width
+        self.hash = 0
+
+    def snapshot(self):
+        """
+        Save the filled positions.
+
+        Returns:
+            tuple: The rows, row counts, column heights and hash.
+
+        """
+        return (tuple(self.rows), tuple(self.row_counts),
+                tuple(self.column_heights), self.hash)
+
+    def restore(self, snapshot):
+        """
+        Restore the filled positions saved by `snapshot`.
+
+        Args:
+            snapshot (tuple): The rows, row counts, column heights and hash.
+        """
+        rows, row_counts, column_heights, self.hash = snapshot
+        self.rows = list(rows)
+        self.row_counts = list(row_counts)
+        self.column_heights = list(column_heights)
+        self.filled_rows = {
+            y for y, count in enumerate(row_counts) if count == self.width}
+
+    def get_filled_indices(self):
+        """
+        Returns the indices of the rows that are completely filled.
+
+        Returns:
+            list (int): The indices filled.
+
+        """
+        return sorted(self.filled_rows)
+
+    def clear_row(self, y):
+        """
+        Unfill every position of the given row.
+
+        Args:
+            y (int): The index of the row to be cleared.
+        """
+        self.hash ^= self.zobrist.hash_row(y, self.rows[y])
+        self.rows[y] = 0
+        self.row_counts[y] = 0
+        self.filled_rows.discard(y)
+        # Only the columns whose surface was in the row get lower
+        columns = 0
+        for x, column_height in enumerate(self.column_heights):
+            if column_height == y + 1:
+                columns |= 1 << x
+        if columns:
+            self.update_column_heights(columns, y)
+
+    def remove_rows(self, indices):
+        """
+        Remove the given rows and shift every row above them down.
+
+        Args:
+            indices (list int): The indices of the rows to be removed.
+        """
+        if not indices:
+            return
+        indices = sorted(indices)
+        # Every row from the lowest removed one changes position
+        start = indices[0]
+        self.hash ^= self.zobrist.hash_rows(self.rows, start)
+        for y in reversed(indices):
+            del self.rows[y]
+            del self.row_counts[y]
+        self.rows.extend([0] * (self.height - len(self.rows)))
+        self.row_counts.extend([0] * (self.height - len(self.row_counts)))
+        self.filled_rows = {
+            y for y, count in enumerate(self.row_counts) if count == self.width
+        }
+        self.hash ^= self.zobrist.hash_rows(self.rows, start)
+
+        # A column's surface drops by the number of removed rows below it,
+        # unless the surface itself was removed and has to be searched for
+        removed = set(indices)
+        columns = 0
+        column_heights = self.column_heights
+        for x, column_height in enumerate(column_heights):
+            if column_height - 1 in removed:
+                columns |= 1 << x
+            elif column_height > start:
+                column_heights[x] -= bisect_left(indices, column_height)
+        if columns:
+            self.update_column_heights(columns)
+
+    def update_column_heights(self, columns=None, top=None):
+        """
+        Recompute the height of columns from the rows.
+
+        Args:
+            columns (int): The bitmask of the columns, None for every column.
+            top (int): The index of a row the columns are known to be empty
+                from, None for the bitboard's height.
+        """
+        remaining = self.full_row if columns is None else columns
+        column_heights = self.column_heights
+        found = remaining
+        while found:
+            bit = found & -found
+            column_heights[bit.bit_length() - 1] = 0
+            found ^= bit
+        for y in reversed(range(self.height if top is None else top)):
+            found = self.rows[y] & remaining
+            remaining ^= found
+            while found:
+                bit = found & -found
+                column_heights[bit.bit_length() - 1] = y + 1
+                found ^= bit
+            if not remaining:
+                break
+
+    def drop_distance(self, squares):
+        """
+        Calculate how far the given squares can move down before colliding.
+
+        Args:
+            squares ([]Square): The squares to be dropped.
+
+        Returns:
+            int: The number of units the squares can move down.
+
+        """
+        column_heights = self.column_heights
+        distance = self.height
+        for square in squares:
+            square_distance = square.y - column_heights[square.x]
+            if square_distance < distance:
+                distance = square_distance
+        if distance >= 0:
+            return distance
+
+        # A square is below its column's surface (e.g. tucked under an
+        # overhang), so the surface can't be used and the squares are
+        # stepped down instead
+        distance = 0
+        while not self.collides(squares, 0, -distance - 1):
+            distance += 1
+        return distance
+
+    def collides(self, squares, x=0, y=0):
+        """
+        Determine whether the given squares, moved by the given offset,
+        overlap a filled position or fall outside of the bitboard.
+
+        Args:
+            squares ([]Square): The squares to be tested.
+            x (int): The horizontal offset applied to every square.
+            y (int): The vertical offset applied to every square.
+
+        Returns:
+            bool: True if any of the squares collides, False otherwise.
+
+        """
+        rows = self.rows
+        width = self.width
+        height = self.height
+        for square in squares:
+            square_x = square.x + x
+            square_y = square.y + y
+            if square_x < 0 or square_x >= width or \
+                    square_y < 0 or square_y >= height or \
+                    (rows[square_y] >> square_x) & 1:
+                return True
+        return False
+
+    def collides_layout(self, layout, x, y):
+        """
+        Determine whether a layout placed at the given origin overlaps a
+        filled position or falls outside of the bitboard.
+
+        Args:
+            layout (list tuple): The squares' positions relative to the origin.
+            x (int): The x coordinate of the origin.
+            y (int): The y coordinate of the origin.
+
+        Returns:
+            bool: True if any of the squares collides, False otherwise.
+
+        """
+        rows = self.rows
+        width = self.width
+        height = self.height
+        for square_x, square_y in layout:
+            square_x += x
+            square_y += y
+            if square_x < 0 or square_x >= width or \
+                    square_y < 0 or square_y >= height or \
+                    (rows[square_y] >> square_x) & 1:
+                return True
+        return False
+
+
+class _Column:
+    """View of a single column of a bitboard, indexable by y."""
+
+    def __init__(self, bitboard, x):
+        self.bitboard = bitboard
+        self.x = x
+
+    def __len__(self):
+        return self.bitboard.height
+
+    def __getitem__(self, y):
+        return (self.bitboard.rows[y] >> self.x) & 1
+
+    def __setitem__(self, y, value):
+        if value:
+            self.bitboard.fill(self.x, y)
+        else:
+            self.bitboard.unfill(self.x, y)
+
+    def __iter__(self):
+        for y in range(self.bitboard.height):
+            yield self[y]
@@ -0,0 +1,165 @@
+import random
+
+from src.bitboard.bitboard import Bitboard
+from src.point.point import Point
+from src.square.square import Square
+from src.colors import colors
+
+
+def test_init():
+    b = Bitboard(10, 22)
+    assert len(b) == 10
+    assert b.full_row == 0b1111111111
+    for column in b:
+        assert len(column) == 22
+        for value in column:
+            assert value == 0
+
+
+def test_fill_unfill():
+    b = Bitboard(10, 22)
+    for i in range(10):
+        for j in range(22):
+            b.fill(i, j)
+            assert b.is_filled(i, j)
+            assert b[i][j] == 1
+            b.unfill(i, j)
+            assert not b.is_filled(i, j)
+            assert b[i][j] == 0
+
+
+def test_column_assignment():
+    b = Bitboard(10, 22)
+    b[3][5] = 1
+    assert b.rows[5] == 1 << 3
+    b[3][5] = 0
+    assert b.rows[5] == 0
+
+
+def test_get_filled_indices():
+    b = Bitboard(10, 22)
+    for i in range(10):
+        b.fill(i, 2)
+        b.fill(i, 7)
+    b.fill(0, 3)
+    assert b.get_filled_indices() == [2, 7]
+
+
+def test_remove_rows():
+    b = Bitboard(10, 22)
+    for i in range(10):
+        b.fill(i, 0)
+        b.fill(i, 2)
+    b.fill(0, 1)
+    b.fill(1, 3)
+    b.remove_rows([0, 2])
+    assert len(b.rows) == 22
+    assert b.rows[0] == 0b1
+    assert b.rows[1] == 0b10
+    assert all(row == 0 for row in b.rows[2:])
+
+
+def test_collides():
+    b = Bitboard(10, 22)
+    b.fill(5, 0)
+    squares = [Square(Point(4, 0), colors.ASH)]
+    assert not b.collides(squares)
+    assert b.collides(squares, 1, 0)
+    assert b.collides(squares, 0, -1)
+    assert b.collides(squares, -5, 0)
+    assert b.collides(squares, 6, 0)
+    assert b.collides(squares, 0, 22)
+
+
+def test_row_counts():
+    b = Bitboard(10, 22)
+    b.fill(0, 0)
+    b.fill(0, 0)
+    b.fill(1, 0)
+    assert b.row_counts[0] == 2
+    b.unfill(1, 0)
+    b.unfill(1, 0)
+    assert b.row_counts[0] == 1
+    for i in range(10):
+        b.fill(i, 4)
+    assert b.row_counts[4] == 10
+    assert b.filled_rows == {4}
+    b.remove_rows([0])
+    assert b.row_counts[3] == 10
+    assert b.filled_rows == {3}
+    b.clear_row(3)
+    assert b.row_counts[3] == 0
+    assert not b.filled_rows
+
+
+def test_column_heights():
+    b = Bitboard(10, 22)
+    b.fill(2, 0)
+    b.fill(2, 5)
+    b.fill(3, 1)
+    assert b.column_heights[:4] == [0, 0, 6, 2]
+    b.unfill(2, 5)
+    assert b.column_heights[2] == 1
+    for i in range(10):
+        b.fill(i, 0)
+    b.clear_row(0)
+    assert b.column_heights[:4] == [0, 0, 0, 2]
+    b.remove_rows([0])
+    assert b.column_heights[:4] == [0, 0, 0, 1]
+
+
+def test_drop_distance():
+    b = Bitboard(10, 22)
+    squares = [Square(Point(4, 10), colors.ASH), Square(Point(5, 11), colors.ASH)]
+    assert b.drop_distance(squares) == 10
+    b.fill(5, 3)
+    assert b.drop_distance(squares) == 7
+    # overhang above the squares
+    b.fill(4, 15)
+    b.fill(5, 15)
+    assert b.drop_distance(squares) == 7
+
+
+def test_hash():
+    b = Bitboard(10, 22)
+    assert b.hash == 0
+    b.fill(1, 1)
+    b.fill(1, 1)
+    first = b.hash
+    assert first != 0
+    b.fill(2, 3)
+    b.unfill(2, 3)
+    assert b.hash == first
+    for i in range(10):
+        b.fill(i, 0)
+        b.fill(i, 2)
+    b.fill(4, 5)
+    b.clear_row(0)
+    assert b.hash == b.zobrist.hash_rows(b.rows)
+    b.remove_rows([0, 2])
+    assert b.hash == b.zobrist.hash_rows(b.rows)
+    expected = Bitboard(10, 22)
+    expected.fill(1, 0)
+    expected.fill(4, 3)
+    assert b.hash == expected.hash
+
+
+def test_column_heights_incremental():
+    rng = random.Random(3)
+    for i in range(200):
+        b = Bitboard(10, 22)
+        for j in range(rng.randrange(120)):
+            b.fill(rng.randrange(10), rng.randrange(12))
+        rows = rng.sample(range(14), rng.randrange(1, 5))
+        for y in rows:
+            if rng.random() < 0.5:
+                b.clear_row(y)
+        b.remove_rows(rows)
+        heights = b.column_heights[:]
+        # the heights kept up to date match heights recomputed from scratch
+        b.update_column_heights()
+        assert heights == b.column_heights
+        b.unfill(rng.randrange(10), rng.randrange(12))
+        heights = b.column_heights[:]
+        b.update_column_heights()
+        assert heights == b.column_heights
@@ -0,0 +1,156 @@
+"""Zobrist hashing of game states."""
+import random
+
+from src.tetromino.constants import IDS
+
+# Fixed seed so that hashes are the same in every process
+SEED = 0x7E7215
+
+ZOBRISTS = {}
+
+
+class Zobrist:
+    """
+    Zobrist holds the random keys hashing the states of a board size.
+
+    A stack's hash is the XOR of the keys of its filled positions, so it
+    can be updated by XORing the keys of the positions that change.
+    """
+
+    def __init__(self, width, height):
+        """
+        Initialize a Zobrist object.
+
+        Args:
+            width (int): The board's width in number of units.
+            height (int): The board's height in number of units.
+        """
+        rng = random.Random(SEED)
+        self.cells = [[rng.getrandbits(64) for x in range(width)]
+                      for y in range(height)]
+        self.row_hashes = [{0: 0} for y in range(height)]
+        self.pieces = {id: rng.getrandbits(64) for id in IDS}
+        self.held = {id: rng.getrandbits(64) for id in IDS}
+        self.held[None] = 0
+        self.states = [rng.getrandbits(64) for state in range(4)]
+        self.xs = [rng.getrandbits(64) for x in range(width + 8)]
+        self.ys = [rng.getrandbits(64) for y in range(height + 8)]
+        self.holdable = rng.getrandbits(64)
+        self.queue = [{id: rng.getrandbits(64) for id in IDS}
+                      for i in range(16)]
+
+    def hash_row(self, y, row):
+        """
+        Hash the filled positions of a row.
+
+        Args:
+            y (int): The index of the row.
+            row (int): The row as a bitmask.
+
+        Returns:
+            int: The hash of the row.
+
+        """
+        row_hashes = self.row_hashes[y]
+        if row in row_hashes:
+            return row_hashes[row]
+        value = 0
+        cells = self.cells[y]
+        remaining = row
+        while remaining:
+            bit = remaining & -remaining
+            value ^= cells[bit.bit_length() - 1]
+            remaining ^= bit
+        row_hashes[row] = value
+        return value
+
+    def hash_rows(self, rows, start=0):
+        """
+        Hash the filled positions of a stack.
+
+        Args:
+            rows (list int): The stack's rows as bitmasks.
+            start (int): The index of the first row to be hashed.
+
+        Returns:
+            int: The hash of the rows from `start`.
+
+        """
+        value = 0
+        for y in range(start, len(rows)):
+            if rows[y]:
+                value ^= self.hash_row(y, rows[y])
+        return value
+
+    def hash_cells(self, cells):
+        """
+        Hash the given positions.
+
+        Args:
+            cells (list tuple): The (x, y) positions.
+
+        Returns:
+            int: The hash of the positions.
+
+        """
+        value = 0
+        for x, y in cells:
+            value ^= self.cells[y][x]
+        return value
+
+    def hash_state(self, stack_hash, id, x, y, state, held, holdable):
+        """
+        Combine a stack's hash with the tetrominos in play.
+
+        Args:
+            stack_hash (int): The hash of the stack.
+            id (string): The identifier of the current tetromino.
+            x (int): The x coordinate of the current tetromino's origin.
+            y (int): The y coordinate of the current tetromino's origin.
+            state (int): The value of the current tetromino's rotation state.
+            held (string): The identifier of the held tetromino, None if
+                there is none.
+            holdable (bool): Whether holding is allowed.
+
+        Returns:
+            int: The hash of the state.
+
+        """
+        value = stack_hash ^ self.pieces[id] ^ self.xs[x + 4] ^ \
+            self.ys[y + 4] ^ self.states[state] ^ self.held[held]
+        if holdable:
+            value ^= self.holdable
+        return value
+
+    def hash_queue(self, queue):
+        """
+        Hash the order of upcoming tetrominos.
+
+        Args:
+            queue (list string): The identifiers of the upcoming tetrominos.
+
+        Returns:
+            int: The hash of the queue.
+
+        """
+        value = 0
+        for i, id in enumerate(queue[:len(self.queue)]):
+            value ^= self.queue[i][id]
+        return value
+
+
+def get_zobrist(width, height):
+    """
+    Get the shared Zobrist keys of a board size.
+
+    Args:
+        width (int): The board's width in number of units.
+        height (int): The board's height in number of units.
+
+    Returns:
+        Zobrist: The keys of the board size.
+
+    """
+    if (width, height) not in ZOBRISTS:
+        ZOBRISTS[(width, height)] = Zobrist(width, height)
+    return ZOBRISTS[(width, height)]
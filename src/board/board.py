@@ -1,58 +1,74 @@
 """Game's playing area."""
-import copy
 import logging
+from collections import namedtuple
 
-from src.colors import colors
+from src.bitboard.bitboard import Bitboard
+from src.ghost.ghost import Ghost
+from src.point.point import Point
 from src.randomizer.randomizer import Randomizer
-from src.renderer.renderer import Renderer
+from src.stack.stack import Stack
+from src.tetromino.constants import COLORS, SPAWN
+from src.tetromino.state import State
+from src.tetromino.tetromino import Tetromino
+from src.trace.trace import Event, tracer
 
 log = logging.getLogger(__name__)
 
+# The state of a board, made of immutable values only so it can be kept and
+# shared freely:
+#   matrix      the bitboard's snapshot
+#   stack       the locked squares' snapshot
+#   current     the (id, x, y, state) of the current tetromino
+#   held        the id of the held tetromino, None if there is none
+#   holdable    whether the current tetromino can be put on hold
+#   randomizer  the randomizer's snapshot, holding the upcoming tetrominos
+Snapshot = namedtuple(
+    "Snapshot",
+    ["matrix", "stack", "current", "held", "holdable", "randomizer"])
+
 
 class Board:
     """Board contains all the tetrominos in the current game."""
 
-    def __init__(self, width, height):
+    def __init__(self, width, height, seed=None):
         """
         Initialize a Board object.
 
         Args:
             width (int): The board's width in number of units.
             height (int): The board's height in number of units.
+            seed (int): The seed of the tetromino order, None for a random seed.
         """
-        log.info(
-            "Initializing board (width={}, height={})".format(width, height)
-        )
+        log.info("Initializing board (width=%s, height=%s)", width, height)
         self.width = width
         self.height = height
-        self.random_tetrominos = Randomizer()
+        self.random_tetrominos = Randomizer(seed)
         self.current_tetromino = self.random_tetrominos.next()
-        self.current_tetromino_matrix = [
-            [0 for y in range(height)] for x in range(width)]
-        self.next_tetromino = self.random_tetrominos.next()
-        self.board_tetrominos_squares = []
-        self.board_tetrominos_matrix = [
-            [0 for y in range(height)] for x in range(width)]
-        self.ghost_tetromino = self.get_ghost_tetromino()
+        self.board_tetrominos_squares = Stack(height)
+        self.board_tetrominos_matrix = Bitboard(width, height)
+        # Incremented whenever the locked tetrominos change
+        self.stack_version = 0
+        # Incremented whenever anything visible on the board changes
+        self.version = 0
+        self.ghost_tetromino = Ghost(self)
         self.holdable = True
         self.held_tetromino = None
+        if tracer.enabled:
+            self.trace_spawn()
 
-    def render_board(self):
-        """Render the contents of the board to the screen."""
-        self.update_matrices()
-
-        # Render the background
-        self.render_background()
-
-        # Render pieces except current one
-        for square in self.board_tetrominos_squares:
-            square.render_square()
+    @property
+    def current_tetromino_matrix(self):
+        """
+        Build a matrix filled at the current tetromino's squares.
 
-        # Render the ghost tetromino
-        self.ghost_tetromino.render_tetromino()
+        Returns:
+            Bitboard: The current tetromino's matrix.
 
-        # Render current playable tetromino
-        self.current_tetromino.render_tetromino()
+        """
+        matrix = Bitboard(self.width, self.height)
+        for square in self.current_tetromino.squares:
+            self.fill_matrix(matrix, square.x, square.y)
+        return matrix
 
     def get_filled_indices(self):
         """
@@ -62,15 +78,7 @@ class Board:
             list (int): The indices filled.
 
         """
-        filled_indices = []
-        for j in range(self.height):
-            filled = True
-            for i in range(self.width):
-                if self.board_tetrominos_matrix[i][j] == 0:
-                    filled = False
-            if filled:
-                filled_indices.append(j)
-        return filled_indices
+        return self.board_tetrominos_matrix.get_filled_indices()
 
     def clear_lines(self, indices):
         """
@@ -80,15 +88,13 @@ class Board:
         Args:
             indices (list int): The list of filled indices.
         """
-
-        #  Needs a copy of the list so it doesn't mutate the original list
-        board_tetrominos_squares_copy = self.board_tetrominos_squares[:]
         for index in indices:
-            for square in self.board_tetrominos_squares:
-                if square.y == index:
-                    board_tetrominos_squares_copy.remove(square)
-
-        self.board_tetrominos_squares = board_tetrominos_squares_copy
+            self.board_tetrominos_squares.clear_row(index)
+            self.board_tetrominos_matrix.clear_row(index)
+        self.stack_version += 1
+        self.version += 1
+        if tracer.enabled and indices:
+            tracer.record(Event.CLEAR, len(indices))
 
     def drop_lines(self, indices):
         """
@@ -97,120 +103,192 @@ class Board:
         Args:
             indices (list int): The list of filled indices.
         """
-        for lines_dropped, index in enumerate(indices):
-            for square in self.board_tetrominos_squares:
-                if square.y > index - lines_dropped:
-                    square.y = square.y - 1
+        self.board_tetrominos_squares.remove_rows(indices)
+        self.board_tetrominos_matrix.remove_rows(indices)
+        self.stack_version += 1
+        self.version += 1
+
+    def lock_current_tetromino(self):
+        """Add the current tetromino's squares to the board's tetrominos."""
+        for square in self.current_tetromino.squares:
+            self.board_tetrominos_squares.append(square)
+            self.fill_matrix(self.board_tetrominos_matrix, square.x, square.y)
+        self.stack_version += 1
+        self.version += 1
+        if tracer.enabled:
+            tetromino = self.current_tetromino
+            tracer.record(Event.LOCK, tetromino.id,
+                          tetromino.origin.x, tetromino.origin.y)
 
     def update_matrices(self):
-        """Update the matrices to match the tetrominos in the board."""
-        self.clear_matrix(self.current_tetromino_matrix)
+        """
+        Rebuild the board's matrix from the tetrominos in the board.
+
+        The matrix is kept up to date as tetrominos are locked and lines are
+        cleared, so this is only needed after changing
+        `board_tetrominos_squares` directly.
+        """
         self.clear_matrix(self.board_tetrominos_matrix)
-        for square in self.board_tetrominos_squares:
-            self.fill_matrix(self.board_tetrominos_matrix, square.x, square.y)
-        for square in self.current_tetromino.squares:
-            self.fill_matrix(self.current_tetromino_matrix, square.x, square.y)
+        for x, y, color in self.board_tetrominos_squares.cells():
+            self.fill_matrix(self.board_tetrominos_matrix, x, y)
+        self.stack_version += 1
+        self.version += 1
 
     def get_ghost_tetromino(self):
         """
-        Return a gray clone of the current tetromino and
-        moves it down by the maximum amount.
+        Return the ghost of the current tetromino, which follows the current
+        tetromino and is kept at its lowest reachable position.
 
         Returns:
-            Tetromino: The ghost tetromino.
+            Ghost: The ghost tetromino.
 
         """
-        self.update_matrices()
-        ghost = copy.deepcopy(self.current_tetromino)
-        for i in range(self.height):
-            ghost.offset(0, -1)
-            for square in ghost.squares:
-                if square.y < 0 or self.board_tetrominos_matrix[square.x][square.y] == 1:
-                    ghost.offset(0, 1)
-                    break
-                square.color = colors.ASH
-        return ghost
+        return self.ghost_tetromino
 
     def switch_current_tetromino(self):
         """Replace the current tetromino with the next tetromino."""
-        self.current_tetromino = self.next_tetromino
-        self.ghost_tetromino = self.get_ghost_tetromino()
-        self.next_tetromino = self.random_tetrominos.next()
+        self.current_tetromino = self.random_tetrominos.next()
+        self.version += 1
+        if tracer.enabled:
+            self.trace_spawn()
+
+    def trace_spawn(self):
+        """Trace the current tetromino becoming the current tetromino."""
+        tetromino = self.current_tetromino
+        tracer.record(Event.SPAWN, tetromino.id,
+                      tetromino.origin.x, tetromino.origin.y)
+
+    def preview(self, n):
+        """
+        Get the identifiers of the upcoming tetrominos.
+
+        Args:
+            n (int): The number of upcoming tetrominos.
+
+        Returns:
+            list (string): The identifiers of the upcoming tetrominos.
+
+        """
+        return self.random_tetrominos.peek(n)
 
     def fill_matrix(self, matrix, x, y):
         """
         Fill the given matrix at the given x and y position.
 
         Args:
-            matrix ([][]int): The matrix with the index to be filled.
+            matrix (Bitboard): The matrix with the index to be filled.
             x (int): The x coordinate of the position to be filled.
             y (int): The y coordinate of the position to be filled.
         """
         if x >= self.width or y >= self.height:
-            log.error(
-                "Position exceeds boundaries: [{}][{}]".format(x, y))
+            log.error("Position exceeds boundaries: [%s][%s]", x, y)
             return
-        matrix[x][y] = 1
+        matrix.fill(x, y)
 
     def unfill_matrix(self, matrix, x, y):
         """
         Fill the given matrix at the given square's indices with a 0.
 
         Args:
-            matrix ([][]int): The matrix with the index to be unfilled.
+            matrix (Bitboard): The matrix with the index to be unfilled.
             x (int): The x coordinate of the position to be unfilled.
             y (int): The y coordinate of the position to be unfilled.
         """
         if x >= self.width or y >= self.height:
-            log.error(
-                "Position exceeds boundaries: [{}][{}]".format(x, y))
+            log.error("Position exceeds boundaries: [%s][%s]", x, y)
             return
-        matrix[x][y] = 0
+        matrix.unfill(x, y)
 
     def clear_matrix(self, matrix):
         """
         Set every element of the given matrix to 0.
 
         Args:
-            matrix ([][]int): The matrix to be cleared.
-        """
-        for i in range(self.width):
-            for j in range(self.height):
-                matrix[i][j] = 0
-
-    def render_background(self):
-        """Render the background squares."""
-        for i in range(self.width):
-            for j in range(self.height):
-                if (i % 2 is 0 and j % 2 is 0) or \
-                        ((i + 1) % 2 is 0 and (j + 1) % 2 is 0):
-                    s = Renderer(i, j, colors.CHARCOAL)
-                else:
-                    s = Renderer(i, j, colors.JET)
-                s.draw()
+            matrix (Bitboard): The matrix to be cleared.
+        """
+        matrix.clear()
 
     def hold_current_tetromino(self):
         """Put the current tetromino on hold to be retrieved later."""
         if self.holdable is False:
-            log.info("Hold slot is already occupied by {}".format(
-                self.held_tetromino.id))
+            log.info("Hold slot is already occupied by %s",
+                     self.held_tetromino.id)
             return
         self.holdable = False
+        if tracer.enabled:
+            tracer.record(Event.HOLD, self.current_tetromino.id,
+                          self.held_tetromino and self.held_tetromino.id)
         if self.held_tetromino is None:
-            log.info("Putting tetromino {} on hold".format(
-                self.current_tetromino.id))
-            self.held_tetromino = copy.deepcopy(self.current_tetromino)
+            log.info("Putting tetromino %s on hold", self.current_tetromino.id)
+            self.held_tetromino = self.current_tetromino
             self.held_tetromino.reset_position()
             self.switch_current_tetromino()
         else:
-            log.info("Putting tetromino {} out of hold".format(
-                self.held_tetromino.id))
+            log.info("Putting tetromino %s out of hold",
+                     self.held_tetromino.id)
             tmp = self.current_tetromino
             self.current_tetromino = self.held_tetromino
-            log.info("Putting tetromino {} on hold".format(tmp.id))
-            self.held_tetromino = copy.deepcopy(tmp)
+            log.info("Putting tetromino %s on hold", tmp.id)
+            self.held_tetromino = tmp
             self.held_tetromino.reset_position()
-        self.ghost_tetromino = self.get_ghost_tetromino()
+        self.version += 1
+
+    def snapshot(self):
+        """
+        Save the state of the game on the board.
+
+        Returns:
+            Snapshot: The board's state.
+
+        """
+        tetromino = self.current_tetromino
+        return Snapshot(
+            self.board_tetrominos_matrix.snapshot(),
+            self.board_tetrominos_squares.snapshot(),
+            (tetromino.id, tetromino.origin.x, tetromino.origin.y,
+             tetromino.state.value),
+            self.held_tetromino.id if self.held_tetromino else None,
+            self.holdable,
+            self.random_tetrominos.snapshot())
+
+    def restore(self, snapshot):
+        """
+        Restore a state saved by `snapshot`.
+
+        Args:
+            snapshot (Snapshot): The board's state.
+        """
+        self.board_tetrominos_matrix.restore(snapshot.matrix)
+        self.board_tetrominos_squares.restore(snapshot.stack)
+        id, x, y, state = snapshot.current
+        self.current_tetromino = Tetromino(id, Point(x, y), COLORS[id])
+        if state:
+            self.current_tetromino.state = State(state)
+            self.current_tetromino.update_squares()
+        self.held_tetromino = None if snapshot.held is None else \
+            Tetromino(snapshot.held, SPAWN[snapshot.held],
+                      COLORS[snapshot.held])
+        self.holdable = snapshot.holdable
+        self.random_tetrominos.restore(snapshot.randomizer)
+        self.stack_version += 1
+        self.version += 1
+
+    def get_hash(self):
+        """
+        Get the Zobrist hash of the board's stack combined with the current
+        and held tetrominos.
+
+        Returns:
+            int: The hash of the board's state.
+
+        """
+        matrix = self.board_tetrominos_matrix
+        tetromino = self.current_tetromino
+        return matrix.zobrist.hash_state(
+            matrix.hash, tetromino.id, tetromino.origin.x, tetromino.origin.y,
+            tetromino.state.value,
+            self.held_tetromino.id if self.held_tetromino else None,
+            self.holdable)
 
     def get_combined_matrix_string(self):
         """
@@ -220,10 +298,11 @@ class Board:
             string: The combined matrix.
 
         """
+        current_tetromino_matrix = self.current_tetromino_matrix
         combined_matrix = "Matrix:\n"
         for j in reversed(range(self.height)):
             for i in range(self.width):
                 combined_matrix += str(self.board_tetrominos_matrix[i][j] or
-                                       self.current_tetromino_matrix[i][j]) + " "
+                                       current_tetromino_matrix[i][j]) + " "
             combined_matrix += "\n"
         return combined_matrix
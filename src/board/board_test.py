@@ -183,3 +183,62 @@ def test_hold_current_tetromino():
     b.hold_current_tetromino()
     assert (b.current_tetromino.origin.x, b.current_tetromino.origin.y) == \
         (SPAWN[b.current_tetromino.id].x, SPAWN[b.current_tetromino.id].y)
+
+
+def test_lock_current_tetromino():
+    b = Board(10, 22)
+    b.current_tetromino = Tetromino("I", Point(0, 0), COLORS["I"])
+    b.lock_current_tetromino()
+    assert len(b.board_tetrominos_squares) == 4
+    for i in range(4):
+        assert b.board_tetrominos_matrix[i][0] == 1
+    assert b.board_tetrominos_matrix.row_counts[0] == 4
+    assert not b.get_filled_indices()
+
+
+def test_version():
+    b = Board(10, 22)
+    m = Movement(b)
+    b.current_tetromino = Tetromino("T", SPAWN["T"], COLORS["T"])
+    version = b.version
+    m.move_left()
+    assert b.version > version
+    version = b.version
+    for i in range(10):
+        m.move_left()
+    assert b.version - version == 2
+    version = b.version
+    m.rotate_cw()
+    assert b.version > version
+    version = b.version
+    m.hard_drop()
+    assert b.version > version
+    version = b.version
+    b.hold_current_tetromino()
+    assert b.version > version
+    version = b.version
+    b.hold_current_tetromino()
+    assert b.version == version
+
+
+def test_preview():
+    b = Board(10, 22, seed=3)
+    upcoming = b.preview(6)
+    for id in upcoming:
+        b.switch_current_tetromino()
+        assert b.current_tetromino.id == id
+
+
+def test_get_hash():
+    a = Board(10, 22, seed=1)
+    b = Board(10, 22, seed=1)
+    assert a.get_hash() == b.get_hash()
+    Movement(a).move_left()
+    assert a.get_hash() != b.get_hash()
+    Movement(a).move_right()
+    assert a.get_hash() == b.get_hash()
+    Movement(a).hard_drop()
+    Movement(b).hard_drop()
+    assert a.get_hash() == b.get_hash()
+    b.hold_current_tetromino()
+    assert a.get_hash() != b.get_hash()
@@ -0,0 +1,278 @@
+"""Computer player."""
+import logging
+import time
+from collections import namedtuple
+
+from src.bitboard.zobrist import get_zobrist
+from src.bot.transposition import TranspositionTable
+from src.engine.action import Action
+from src.engine.movegen import Placement, get_actions, search
+from src.tetromino.constants import SPAWN
+
+log = logging.getLogger(__name__)
+
+# A move is an optional hold followed by the placement of the resulting
+# current tetromino
+Move = namedtuple("Move", ["hold", "placement"])
+
+# Weights of the board features, from Yiyuan Lee's "Tetris AI"
+WEIGHTS = {
+    "height": -0.510066,
+    "lines": 0.760666,
+    "holes": -0.35663,
+    "bumpiness": -0.184483,
+}
+
+
+def place(rows, width, cells):
+    """
+    Fill the given squares of a board and clear the filled lines.
+
+    Args:
+        rows (tuple int): The board's rows as bitmasks.
+        width (int): The board's width in number of units.
+        cells (tuple): The (x, y) positions to be filled.
+
+    Returns:
+        tuple: The resulting rows and the number of lines cleared.
+
+    """
+    rows = list(rows)
+    for x, y in cells:
+        rows[y] |= 1 << x
+    full_row = (1 << width) - 1
+    kept = [row for row in rows if row != full_row]
+    lines = len(rows) - len(kept)
+    kept.extend([0] * lines)
+    return tuple(kept), lines
+
+
+def get_features(rows, width):
+    """
+    Measure the features of a board used to evaluate it.
+
+    Args:
+        rows (tuple int): The board's rows as bitmasks.
+        width (int): The board's width in number of units.
+
+    Returns:
+        tuple: The aggregate height, the number of holes and the bumpiness
+        of the board.
+
+    """
+    column_heights = [0] * width
+    holes = 0
+    covered = 0
+    for y in range(len(rows) - 1, -1, -1):
+        row = rows[y]
+        found = row & ~covered
+        while found:
+            bit = found & -found
+            column_heights[bit.bit_length() - 1] = y + 1
+            found ^= bit
+        covered |= row
+        if covered != row:
+            holes += bin(covered & ~row).count("1")
+    bumpiness = 0
+    for i in range(width - 1):
+        bumpiness += abs(column_heights[i] - column_heights[i + 1])
+    return sum(column_heights), holes, bumpiness
+
+
+def evaluate(rows, width, lines, weights=WEIGHTS):
+    """
+    Score a board, higher being better.
+
+    Args:
+        rows (tuple int): The board's rows as bitmasks.
+        width (int): The board's width in number of units.
+        lines (int): The number of lines cleared to reach the board.
+        weights (dict): The weight of each feature.
+
+    Returns:
+        float: The board's score.
+
+    """
+    height, holes, bumpiness = get_features(rows, width)
+    return weights["height"] * height + weights["lines"] * lines + \
+        weights["holes"] * holes + weights["bumpiness"] * bumpiness
+
+
+class Bot:
+    """
+    A bot chooses moves with a beam search over the placements of the
+    current tetromino, the previewed ones and the held one.
+
+    The search works on boards stored as tuples of row bitmasks, so no
+    Board objects are copied or changed while searching. Boards are
+    identified by their Zobrist hash: the same board reached through
+    different move orders is only expanded once, and the evaluations and
+    chosen moves are cached in two transposition tables, so the boards
+    scored while searching don't evict the chosen moves.
+    """
+
+    def __init__(self, beam_width=4, depth=3, time_budget=0.01,
+                 weights=WEIGHTS, scores=None, moves=None):
+        """
+        Initialize a Bot object.
+
+        Args:
+            beam_width (int): The number of boards kept at each depth.
+            depth (int): The number of tetrominos placed in the search.
+            time_budget (float): The number of seconds after which the
+                search stops going deeper.
+            weights (dict): The weight of each board feature.
+            scores (TranspositionTable): The cache of board evaluations,
+                keyed by the boards' hashes, None for a new one.
+            moves (TranspositionTable): The cache of chosen moves, keyed by
+                the hashes of the boards and their queues, None for a new
+                one.
+        """
+        self.beam_width = beam_width
+        self.depth = depth
+        self.time_budget = time_budget
+        self.weights = weights
+        self.scores = scores if scores is not None else TranspositionTable()
+        self.moves = moves if moves is not None else TranspositionTable()
+
+    def get_score(self, rows, width, stack_hash):
+        """
+        Score a board without its cleared lines, using the cached score if
+        the board was already evaluated.
+
+        Args:
+            rows (tuple int): The board's rows as bitmasks.
+            width (int): The board's width in number of units.
+            stack_hash (int): The Zobrist hash of the board.
+
+        Returns:
+            float: The board's score.
+
+        """
+        entry = self.scores.get(stack_hash)
+        if entry is not None:
+            return entry.score
+        score = evaluate(rows, width, 0, self.weights)
+        self.scores.put(stack_hash, score)
+        return score
+
+    def get_options(self, queue, held, index, holdable):
+        """
+        List the ways of getting the next tetromino to place.
+
+        Args:
+            queue (list string): The current and upcoming tetrominos.
+            held (string): The held tetromino, None if there is none.
+            index (int): The index in the queue of the current tetromino.
+            holdable (bool): Whether holding is allowed.
+
+        Returns:
+            list tuple: The hold flag, the tetromino to place, the
+            resulting held tetromino and the resulting queue index of each
+            option.
+
+        """
+        if index >= len(queue):
+            return []
+        options = [(False, queue[index], held, index + 1)]
+        if holdable and held is None and index + 1 < len(queue):
+            options.append((True, queue[index + 1], queue[index], index + 2))
+        elif holdable and held is not None and held != queue[index]:
+            options.append((True, held, queue[index], index + 1))
+        return options
+
+    def choose(self, board):
+        """
+        Choose the move for the board's current tetromino.
+
+        Args:
+            board (Board): The board being played.
+
+        Returns:
+            Move: The chosen move, or None if no placement is possible.
+
+        """
+        start = time.perf_counter()
+        width = board.width
+        height = board.height
+        zobrist = get_zobrist(width, height)
+        tetromino = board.current_tetromino
+        queue = [tetromino.id] + board.preview(self.depth)
+        key = board.get_hash() ^ zobrist.hash_queue(queue[1:])
+        entry = self.moves.get(key)
+        if entry is not None:
+            return entry.move
+
+        held = board.held_tetromino.id if board.held_tetromino else None
+        matrix = board.board_tetrominos_matrix
+        # (score, rows, stack hash, held, queue index, lines cleared,
+        # first move)
+        beam = [(0.0, tuple(matrix.rows), matrix.hash, held, 0, 0, None)]
+        for depth in range(self.depth):
+            children = {}
+            for score, rows, stack_hash, held, index, lines, move in beam:
+                options = self.get_options(
+                    queue, held, index, depth > 0 or board.holdable)
+                for hold, id, new_held, new_index in options:
+                    if depth == 0 and not hold:
+                        origin = (tetromino.origin.x, tetromino.origin.y,
+                                  tetromino.state.value)
+                    else:
+                        origin = (SPAWN[id].x, SPAWN[id].y, 0)
+                    locks, parents = search(rows, width, height, id, *origin)
+                    for cells, node in locks.items():
+                        new_rows, cleared = place(rows, width, cells)
+                        if cleared:
+                            new_hash = zobrist.hash_rows(new_rows)
+                        else:
+                            new_hash = stack_hash ^ zobrist.hash_cells(cells)
+                        child_key = (new_hash, new_held, new_index)
+                        new_lines = lines + cleared
+                        new_score = self.get_score(
+                            new_rows, width, new_hash) + \
+                            self.weights["lines"] * new_lines
+                        if child_key in children and \
+                                children[child_key][0] >= new_score:
+                            continue
+                        children[child_key] = (
+                            new_score, new_rows, new_hash, new_held,
+                            new_index, new_lines,
+                            move or Move(hold, Placement(*node)))
+            if not children:
+                break
+            beam = sorted(children.values(), key=lambda child: child[0],
+                          reverse=True)[:self.beam_width]
+            if time.perf_counter() - start > self.time_budget:
+                break
+
+        move = beam[0][6]
+        if move is not None:
+            self.moves.put(key, beam[0][0], move)
+        return move
+
+    def play(self, engine):
+        """
+        Choose and apply the move for the engine's current tetromino.
+
+        Args:
+            engine (Engine): The engine of the game being played.
+
+        Returns:
+            bool: True if a move was applied, False otherwise.
+
+        """
+        if engine.game_over:
+            return False
+        move = self.choose(engine.board)
+        if move is None:
+            engine.step(Action.HARD_DROP)
+            return False
+        if move.hold:
+            engine.step(Action.HOLD)
+        actions = get_actions(engine.board, move.placement)
+        if actions is None:
+            log.warning("Placement %s is unreachable", move.placement)
+            actions = [Action.HARD_DROP]
+        for action in actions:
+            engine.step(action)
+        return True
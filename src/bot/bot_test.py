@@ -0,0 +1,59 @@
+from src.bot.bot import Bot, evaluate, get_features, place
+from src.engine.engine import Engine
+from src.engine.movegen import get_placements
+
+
+def test_place():
+    rows = (0b1111111110, 0b0000000010) + (0,) * 20
+    new_rows, lines = place(rows, 10, [(0, 0), (0, 1)])
+    assert lines == 1
+    assert new_rows[0] == 0b0000000011
+    assert len(new_rows) == 22
+    assert not any(new_rows[1:])
+
+
+def test_get_features():
+    # column 0 is 3 high with 2 holes, column 2 is 1 high
+    rows = (0b100, 0b000, 0b001) + (0,) * 19
+    height, holes, bumpiness = get_features(rows, 3)
+    assert height == 4
+    assert holes == 2
+    assert bumpiness == 3 + 1
+
+
+def test_evaluate():
+    flat = (0b1111111100,) + (0,) * 21
+    tall = (0b0000000001,) * 8 + (0,) * 14
+    assert evaluate(flat, 10, 0) > evaluate(tall, 10, 0)
+
+
+def test_choose():
+    e = Engine(seed=5)
+    move = Bot().choose(e.board)
+    assert move is not None
+    if move.hold:
+        e.board.hold_current_tetromino()
+    assert move.placement in get_placements(e.board)
+
+
+def test_choose_cached():
+    e = Engine(seed=5)
+    bot = Bot(time_budget=1)
+    move = bot.choose(e.board)
+    # the scores of the searched boards and the chosen move are kept apart
+    assert len(bot.moves) == 1
+    assert len(bot.scores) > 1
+    scores = bot.scores.get_stats()
+    assert bot.choose(e.board) == move
+    assert bot.moves.get_stats()["hits"] == 1
+    assert bot.scores.get_stats() == scores
+
+
+def test_play():
+    e = Engine(seed=5)
+    bot = Bot(time_budget=1)
+    for i in range(100):
+        assert bot.play(e)
+    assert not e.game_over
+    assert e.pieces == 100
+    assert e.lines > 30
@@ -0,0 +1,87 @@
+"""Cache of search results."""
+from collections import OrderedDict, namedtuple
+
+# The evaluation of a state and the best move found from it
+Entry = namedtuple("Entry", ["score", "move"])
+
+
+class TranspositionTable:
+    """
+    A transposition table caches search results keyed by state hashes, so
+    states reached through different move orders are only evaluated once.
+
+    The table is bounded and evicts the least recently used entries.
+    """
+
+    def __init__(self, maxsize=1 << 16):
+        """
+        Initialize a TranspositionTable object.
+
+        Args:
+            maxsize (int): The maximum number of entries.
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Look up the entry of a state.
+
+        Args:
+            key (int): The hash of the state.
+
+        Returns:
+            Entry: The state's entry, None if it isn't in the table.
+
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, score, move=None):
+        """
+        Store the entry of a state.
+
+        Args:
+            key (int): The hash of the state.
+            score (float): The evaluation of the state.
+            move (Move): The best move from the state, None if unknown.
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        elif len(self.entries) >= self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        self.entries[key] = Entry(score, move)
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self):
+        """
+        Get the table's counters.
+
+        Returns:
+            dict: The number of entries, hits, misses and evictions.
+
+        """
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
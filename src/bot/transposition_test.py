@@ -0,0 +1,28 @@
+from src.bot.transposition import TranspositionTable
+
+
+def test_get_put():
+    t = TranspositionTable(4)
+    assert t.get(1) is None
+    t.put(1, 0.5, "move")
+    entry = t.get(1)
+    assert entry.score == 0.5
+    assert entry.move == "move"
+    assert t.get_stats() == {
+        "entries": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_eviction():
+    t = TranspositionTable(3)
+    for key in range(3):
+        t.put(key, key)
+    # key 0 becomes the most recently used, so key 1 is evicted
+    t.get(0)
+    t.put(3, 3)
+    assert len(t) == 3
+    assert t.evictions == 1
+    assert t.get(1) is None
+    assert t.get(0).score == 0
+    t.clear()
+    assert len(t) == 0
+    assert t.get_stats()["misses"] == 0
@@ -1,11 +1,11 @@
-"""List of pre-defined colors"""
-YELLOW = [244, 197, 36]
-TEAL = [70, 194, 255]
-BLUE = [54, 99, 246]
-ORANGE = [237, 130, 33]
-GREEN = [124, 227, 22]
-RED = [245, 61, 102]
-PURPLE = [227, 72, 192]
-ASH = [100, 100, 100]
-CHARCOAL = [40, 40, 40]
-JET = [43, 43, 43]
+"""List of pre-defined colors as shared, immutable (R, G, B) tuples"""
+YELLOW = (244, 197, 36)
+TEAL = (70, 194, 255)
+BLUE = (54, 99, 246)
+ORANGE = (237, 130, 33)
+GREEN = (124, 227, 22)
+RED = (245, 61, 102)
+PURPLE = (227, 72, 192)
+ASH = (100, 100, 100)
+CHARCOAL = (40, 40, 40)
+JET = (43, 43, 43)
@@ -0,0 +1,14 @@
+"""Player actions."""
+from enum import Enum
+
+
+class Action(Enum):
+    """Action is one of the inputs a player can give to the game."""
+
+    LEFT = 0
+    RIGHT = 1
+    DOWN = 2
+    ROTATE_CW = 3
+    ROTATE_CCW = 4
+    HARD_DROP = 5
+    HOLD = 6
@@ -0,0 +1,222 @@
+"""Headless game engine."""
+import logging
+from collections import namedtuple
+
+from src.board.board import Board
+from src.engine.action import Action
+from src.movement.movement import Movement
+
+log = logging.getLogger(__name__)
+
+# Number of ticks between the rows the current tetromino falls by
+GRAVITY = 30
+# Number of ticks the current tetromino can rest on the stack before locking
+LOCK_DELAY = 30
+# Number of times moving or lifting a resting tetromino can restart its lock
+# delay before it reaches a new lowest row
+MAX_LOCK_RESETS = 15
+
+# The state of a game, the board's snapshot along with the engine's counters
+# and the (ticks, gravity ticks, lock ticks, lock resets, lock position,
+# lowest row) of its timers
+EngineSnapshot = namedtuple(
+    "EngineSnapshot",
+    ["board", "game_over", "pieces", "lines", "holds", "timers"])
+
+
+class Engine:
+    """
+    Engine runs a game by applying actions to a board.
+
+    The engine only depends on the game logic and never imports pyglet, so
+    games can be simulated without a display. The window and keyboard are
+    a frontend that feed actions to an engine.
+
+    Time advances in fixed ticks through `tick`, which applies gravity and
+    the lock delay. Games that never tick, like the headless runner's, only
+    advance through actions.
+    """
+
+    def __init__(self, width=10, height=22, seed=None, gravity=GRAVITY,
+                 lock_delay=LOCK_DELAY):
+        """
+        Initialize an Engine object.
+
+        Args:
+            width (int): The board's width in number of units.
+            height (int): The board's height in number of units.
+            seed (int): The seed of the tetromino order, None for a random seed.
+            gravity (int): The number of ticks between the rows the current
+                tetromino falls by.
+            lock_delay (int): The number of ticks the current tetromino can
+                rest on the stack before locking.
+        """
+        self.board = Board(width, height, seed)
+        self.movement = Movement(self.board)
+        self.game_over = False
+        self.pieces = 0
+        self.lines = 0
+        self.holds = 0
+        self.gravity = gravity
+        self.lock_delay = lock_delay
+        self.ticks = 0
+        self.reset_timers()
+        # Records the applied actions when set, see src.replay.replay
+        self.recorder = None
+        self.actions = {
+            Action.LEFT: self.movement.move_left,
+            Action.RIGHT: self.movement.move_right,
+            Action.DOWN: self.movement.move_down,
+            Action.ROTATE_CW: self.movement.rotate_cw,
+            Action.ROTATE_CCW: self.movement.rotate_ccw,
+            Action.HARD_DROP: self.hard_drop,
+            Action.HOLD: self.hold,
+        }
+
+    def step(self, action):
+        """
+        Apply an action to the game.
+
+        Args:
+            action (Action): The action to be applied.
+
+        Returns:
+            int: The number of lines cleared by the action.
+
+        """
+        if self.game_over:
+            return 0
+        if self.recorder is not None:
+            self.recorder.record(action)
+        return self.actions[action]() or 0
+
+    def hard_drop(self):
+        """
+        Hard drop the current tetromino and check whether the next one fits.
+
+        Returns:
+            int: The number of lines cleared.
+
+        """
+        lines = self.movement.hard_drop()
+        self.reset_timers()
+        self.pieces += 1
+        self.lines += lines
+        self.check_game_over()
+        return lines
+
+    def hold(self):
+        """Put the current tetromino on hold if the hold slot is available."""
+        if self.board.holdable:
+            self.holds += 1
+            self.reset_timers()
+        self.board.hold_current_tetromino()
+        # The tetromino taken out of hold spawns and may overlap the stack
+        self.check_game_over()
+
+    def check_game_over(self):
+        """End the game if the current tetromino overlaps the stack."""
+        if self.board.board_tetrominos_matrix.collides(
+                self.board.current_tetromino.squares):
+            log.info("Game over after %s pieces", self.pieces)
+            self.game_over = True
+
+    @property
+    def grounded(self):
+        """
+        Determine whether the current tetromino rests on the stack or floor.
+
+        Returns:
+            bool: True if the current tetromino can't move down.
+
+        """
+        return self.board.board_tetrominos_matrix.collides(
+            self.board.current_tetromino.squares, 0, -1)
+
+    def reset_timers(self):
+        """Restart the gravity and lock delay for a new current tetromino."""
+        self.gravity_ticks = 0
+        self.lock_ticks = 0
+        self.lock_resets = 0
+        self.lock_position = None
+        self.lowest_row = None
+
+    def tick(self):
+        """
+        Advance the game by one tick, letting the current tetromino fall
+        and locking it once it rested on the stack for the lock delay.
+
+        Moving, rotating or lifting a resting tetromino restarts its lock
+        delay up to MAX_LOCK_RESETS times. Only reaching a new lowest row
+        restarts it without limit, so a tetromino can't be kept from locking
+        by kicking it up and letting it land again.
+
+        Returns:
+            int: The number of lines cleared.
+
+        """
+        if self.game_over:
+            return 0
+        self.ticks += 1
+        tetromino = self.board.current_tetromino
+        bottom = min(square.y for square in tetromino.squares)
+        if self.lowest_row is None or bottom < self.lowest_row:
+            self.lowest_row = bottom
+            self.lock_ticks = 0
+            self.lock_resets = 0
+            self.lock_position = None
+
+        if not self.grounded:
+            if self.lock_position is not None:
+                # Lifted off the stack
+                if self.lock_resets < MAX_LOCK_RESETS:
+                    self.lock_resets += 1
+                    self.lock_ticks = 0
+                self.lock_position = None
+            self.gravity_ticks += 1
+            if self.gravity_ticks >= self.gravity:
+                self.gravity_ticks = 0
+                self.movement.move_down()
+            return 0
+
+        position = (tetromino.origin.x, tetromino.origin.y,
+                    tetromino.state.value)
+        if position != self.lock_position:
+            if self.lock_position is not None and \
+                    self.lock_resets < MAX_LOCK_RESETS:
+                self.lock_resets += 1
+                self.lock_ticks = 0
+            self.lock_position = position
+        self.lock_ticks += 1
+        if self.lock_ticks >= self.lock_delay:
+            return self.hard_drop()
+        return 0
+
+    def snapshot(self):
+        """
+        Save the state of the game, to branch from it or undo moves.
+
+        Returns:
+            EngineSnapshot: The game's state.
+
+        """
+        return EngineSnapshot(
+            self.board.snapshot(), self.game_over, self.pieces, self.lines,
+            self.holds, (self.ticks, self.gravity_ticks, self.lock_ticks,
+                         self.lock_resets, self.lock_position,
+                         self.lowest_row))
+
+    def restore(self, snapshot):
+        """
+        Restore a state saved by `snapshot`.
+
+        Args:
+            snapshot (EngineSnapshot): The game's state.
+        """
+        self.board.restore(snapshot.board)
+        self.game_over = snapshot.game_over
+        self.pieces = snapshot.pieces
+        self.lines = snapshot.lines
+        self.holds = snapshot.holds
+        (self.ticks, self.gravity_ticks, self.lock_ticks, self.lock_resets,
+         self.lock_position, self.lowest_row) = snapshot.timers
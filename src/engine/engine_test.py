@@ -0,0 +1,179 @@
+import random
+import subprocess
+import sys
+
+from src.engine.action import Action
+from src.engine.engine import MAX_LOCK_RESETS, Engine
+from src.runner.runner import random_policy
+from src.tetromino.constants import COLORS, SPAWN
+from src.tetromino.tetromino import Tetromino
+
+
+def test_no_pyglet():
+    code = ("import sys; import src.engine.engine; "
+            "sys.exit('pyglet' in sys.modules)")
+    assert subprocess.call([sys.executable, "-c", code]) == 0
+
+
+def test_step():
+    e = Engine()
+    e.board.current_tetromino = Tetromino("I", SPAWN["I"], COLORS["I"])
+    e.step(Action.LEFT)
+    assert e.board.current_tetromino.origin.x == SPAWN["I"].x - 1
+    e.step(Action.RIGHT)
+    e.step(Action.RIGHT)
+    assert e.board.current_tetromino.origin.x == SPAWN["I"].x + 1
+    e.step(Action.DOWN)
+    assert e.board.current_tetromino.origin.y == SPAWN["I"].y - 1
+    e.step(Action.ROTATE_CW)
+    e.step(Action.ROTATE_CCW)
+    assert e.step(Action.HARD_DROP) == 0
+    assert e.pieces == 1
+    assert len(e.board.board_tetrominos_squares) == 4
+    e.step(Action.HOLD)
+    e.step(Action.HOLD)
+    assert e.holds == 1
+
+
+def test_lines():
+    e = Engine()
+    for x in [0, 4]:
+        e.board.current_tetromino = Tetromino("I", SPAWN["I"], COLORS["I"])
+        e.board.current_tetromino.offset(x - SPAWN["I"].x, 0)
+        e.step(Action.HARD_DROP)
+    e.board.current_tetromino = Tetromino("O", SPAWN["O"], COLORS["O"])
+    e.board.current_tetromino.offset(8 - SPAWN["O"].x, 0)
+    assert e.step(Action.HARD_DROP) == 1
+    assert e.lines == 1
+
+
+def test_game_over():
+    e = Engine()
+    while not e.game_over:
+        e.step(Action.HARD_DROP)
+    pieces = e.pieces
+    e.step(Action.HARD_DROP)
+    assert e.pieces == pieces
+
+
+def test_game_over_hold():
+    e = Engine()
+    e.board.current_tetromino = Tetromino("I", SPAWN["I"], COLORS["I"])
+    e.step(Action.HOLD)
+    e.step(Action.HARD_DROP)
+    e.board.current_tetromino = Tetromino("O", SPAWN["O"], COLORS["O"])
+    # block the spawn position of the held I but not the current O
+    current = {(s.x, s.y) for s in e.board.current_tetromino.squares}
+    for square in e.board.held_tetromino.squares:
+        if (square.x, square.y) not in current:
+            e.board.board_tetrominos_matrix.fill(square.x, square.y)
+    assert not e.game_over
+    e.step(Action.HOLD)
+    assert e.board.current_tetromino.id == "I"
+    assert e.game_over
+
+
+def play_random(e, rng, pieces):
+    actions = []
+    while not e.game_over and e.pieces < pieces:
+        for action in random_policy(e, rng):
+            e.step(action)
+            actions.append(action)
+    return actions
+
+
+def get_state(e):
+    b = e.board
+    return (b.get_hash(), list(b.board_tetrominos_squares.cells()),
+            [(s.x, s.y) for s in b.current_tetromino.squares], b.preview(5),
+            e.pieces, e.lines, e.holds, e.game_over)
+
+
+def test_snapshot_restore():
+    e = Engine(seed=4)
+    rng = random.Random(4)
+    play_random(e, rng, 5)
+    e.step(Action.ROTATE_CW)
+    snapshot = e.snapshot()
+    state = get_state(e)
+    actions = play_random(e, rng, 12)
+    after = get_state(e)
+
+    e.restore(snapshot)
+    assert get_state(e) == state
+    for action in actions:
+        e.step(action)
+    assert get_state(e) == after
+    # restoring twice gives the same state as a snapshot is never modified
+    e.restore(snapshot)
+    assert get_state(e) == state
+
+
+def test_snapshot_restore_refill():
+    e = Engine(seed=2)
+    snapshot = e.snapshot()
+    upcoming = e.board.preview(10)
+    # previewing far ahead refills the randomizer's queue
+    e.board.preview(500)
+    e.board.switch_current_tetromino()
+    e.restore(snapshot)
+    assert e.board.preview(10) == upcoming
+
+
+def test_gravity():
+    e = Engine(gravity=3)
+    y = e.board.current_tetromino.origin.y
+    for i in range(7):
+        e.tick()
+    assert e.ticks == 7
+    assert e.board.current_tetromino.origin.y == y - 2
+
+
+def test_lock_delay():
+    e = Engine(lock_delay=5)
+    e.board.current_tetromino = Tetromino("I", SPAWN["I"], COLORS["I"])
+    e.board.current_tetromino.offset(0, -SPAWN["I"].y)
+    assert e.grounded
+    for i in range(4):
+        e.tick()
+    assert e.pieces == 0
+    # moving restarts the lock delay
+    e.step(Action.LEFT)
+    for i in range(4):
+        e.tick()
+    assert e.pieces == 0
+    e.tick()
+    assert e.pieces == 1
+    assert len(e.board.board_tetrominos_squares) == 4
+
+
+def test_lock_resets():
+    e = Engine(lock_delay=2)
+    e.board.current_tetromino = Tetromino("I", SPAWN["I"], COLORS["I"])
+    e.board.current_tetromino.offset(0, -SPAWN["I"].y)
+    # the first tick on the ground starts the lock delay, the next moves
+    # restart it
+    for i in range(MAX_LOCK_RESETS + 1):
+        e.step(Action.LEFT if i % 2 else Action.RIGHT)
+        e.tick()
+    assert e.pieces == 0
+    e.step(Action.LEFT)
+    e.tick()
+    assert e.pieces == 1
+
+
+def test_lock_lift():
+    e = Engine(gravity=1, lock_delay=3)
+    e.board.current_tetromino = Tetromino("T", SPAWN["T"], COLORS["T"])
+    e.board.current_tetromino.offset(0, -SPAWN["T"].y)
+    # lifting the tetromino and letting it land again restarts the lock
+    # delay a limited number of times
+    for i in range(100):
+        e.tick()
+        e.tick()
+        if e.pieces:
+            break
+        e.movement.move_up()
+        e.tick()
+    assert e.pieces == 1
+    assert i > MAX_LOCK_RESETS // 2
@@ -0,0 +1,197 @@
+"""Enumeration of the placements reachable by a tetromino."""
+import logging
+from collections import deque, namedtuple
+
+from src.engine.action import Action
+from src.tetromino.constants import CCW, CW, ROTATIONS, WALL_KICKS
+
+log = logging.getLogger(__name__)
+
+# The position and rotation state of a tetromino's origin where it locks
+Placement = namedtuple("Placement", ["x", "y", "state"])
+
+
+def _get_shape(layout):
+    """
+    Describe a layout as a bounding box and one bitmask per row.
+
+    Args:
+        layout (tuple): The squares' positions relative to the origin.
+
+    Returns:
+        tuple: The minimum and maximum x and y offsets and the
+        (y offset, row mask) of every row, where the row masks are shifted
+        so that the minimum x offset is bit 0.
+
+    """
+    min_x = min(x for x, y in layout)
+    max_x = max(x for x, y in layout)
+    min_y = min(y for x, y in layout)
+    max_y = max(y for x, y in layout)
+    masks = {}
+    for x, y in layout:
+        masks[y] = masks.get(y, 0) | 1 << (x - min_x)
+    return min_x, max_x, min_y, max_y, tuple(sorted(masks.items()))
+
+
+SHAPES = {
+    (id, state): _get_shape(layout)
+    for id, layouts in ROTATIONS.items()
+    for state, layout in enumerate(layouts)
+}
+
+
+def fits(rows, width, height, shape, x, y):
+    """
+    Determine whether a shape placed at the given origin is inside the
+    board and doesn't overlap a filled position.
+
+    Args:
+        rows (list int): The board's rows as bitmasks.
+        width (int): The board's width in number of units.
+        height (int): The board's height in number of units.
+        shape (tuple): The shape from `SHAPES`.
+        x (int): The x coordinate of the origin.
+        y (int): The y coordinate of the origin.
+
+    Returns:
+        bool: True if the shape fits, False otherwise.
+
+    """
+    min_x, max_x, min_y, max_y, masks = shape
+    left = x + min_x
+    if left < 0 or x + max_x >= width or y + min_y < 0 or y + max_y >= height:
+        return False
+    for offset, mask in masks:
+        if rows[y + offset] & (mask << left):
+            return False
+    return True
+
+
+def search(rows, width, height, id, x, y, state):
+    """
+    Find every position where a tetromino can lock with a breadth-first
+    search over the (x, y, state) positions it can reach by moving left,
+    right and down and by rotating with wall kicks.
+
+    Above the highest filled position every height is equivalent, so a
+    tetromino there is moved straight down to that height instead of one
+    unit at a time.
+
+    Args:
+        rows (list int): The board's rows as bitmasks.
+        width (int): The board's width in number of units.
+        height (int): The board's height in number of units.
+        id (string): The identifier of the tetromino.
+        x (int): The x coordinate of the tetromino's origin.
+        y (int): The y coordinate of the tetromino's origin.
+        state (int): The value of the tetromino's rotation state.
+
+    Returns:
+        tuple: The lock positions keyed by the squares they occupy, and the
+        (previous position, action, repeat) that first reached every
+        position.
+
+    """
+    start = (x, y, state)
+    if not fits(rows, width, height, SHAPES[(id, state)], x, y):
+        return {}, {}
+
+    top = height
+    while top > 0 and not rows[top - 1]:
+        top -= 1
+    rotations = () if id == "O" else (CW, CCW)
+    parents = {start: None}
+    locks = {}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        x, y, state = node
+        shape = SHAPES[(id, state)]
+
+        neighbours = []
+        # moving down, straight to the highest filled position if above it
+        lowest = top - shape[2]
+        if y > lowest:
+            neighbours.append(((x, lowest, state), Action.DOWN, y - lowest))
+        elif fits(rows, width, height, shape, x, y - 1):
+            neighbours.append(((x, y - 1, state), Action.DOWN, 1))
+        else:
+            cells = tuple(sorted(
+                (x + dx, y + dy) for dx, dy in ROTATIONS[id][state]))
+            if cells not in locks:
+                locks[cells] = node
+        if fits(rows, width, height, shape, x - 1, y):
+            neighbours.append(((x - 1, y, state), Action.LEFT, 1))
+        if fits(rows, width, height, shape, x + 1, y):
+            neighbours.append(((x + 1, y, state), Action.RIGHT, 1))
+        for direction in rotations:
+            rotated = (state + direction) % 4
+            rotated_shape = SHAPES[(id, rotated)]
+            for kick_x, kick_y in WALL_KICKS[(id, state, direction)]:
+                if fits(rows, width, height, rotated_shape,
+                        x + kick_x, y + kick_y):
+                    neighbours.append((
+                        (x + kick_x, y + kick_y, rotated),
+                        Action.ROTATE_CW if direction == CW else
+                        Action.ROTATE_CCW, 1))
+                    break
+
+        for neighbour, action, repeat in neighbours:
+            if neighbour not in parents:
+                parents[neighbour] = (node, action, repeat)
+                queue.append(neighbour)
+    return locks, parents
+
+
+def get_placements(board):
+    """
+    Find every distinct position where the board's current tetromino can
+    lock.
+
+    Placements occupying the same squares (e.g. the rotations of an O) are
+    only returned once.
+
+    Args:
+        board (Board): The board with the tetromino to be placed.
+
+    Returns:
+        list (Placement): The reachable placements.
+
+    """
+    tetromino = board.current_tetromino
+    locks, parents = search(
+        board.board_tetrominos_matrix.rows, board.width, board.height,
+        tetromino.id, tetromino.origin.x, tetromino.origin.y,
+        tetromino.state.value)
+    return [Placement(*node) for node in locks.values()]
+
+
+def get_actions(board, placement):
+    """
+    Find the actions moving the board's current tetromino to a placement
+    and locking it there.
+
+    Args:
+        board (Board): The board with the tetromino to be placed.
+        placement (Placement): A placement from `get_placements`.
+
+    Returns:
+        list (Action): The actions, or None if the placement can't be
+        reached.
+
+    """
+    tetromino = board.current_tetromino
+    locks, parents = search(
+        board.board_tetrominos_matrix.rows, board.width, board.height,
+        tetromino.id, tetromino.origin.x, tetromino.origin.y,
+        tetromino.state.value)
+    node = tuple(placement)
+    if node not in parents:
+        return None
+    actions = [Action.HARD_DROP]
+    while parents[node] is not None:
+        node, action, repeat = parents[node]
+        actions.extend([action] * repeat)
+    actions.reverse()
+    return actions
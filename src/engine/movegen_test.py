@@ -0,0 +1,60 @@
+from src.board.board import Board
+from src.engine.action import Action
+from src.engine.engine import Engine
+from src.engine.movegen import Placement, get_actions, get_placements
+from src.tetromino.constants import COLORS, ROTATIONS, SPAWN
+from src.tetromino.tetromino import Tetromino
+
+
+def set_tetromino(board, id):
+    board.current_tetromino = Tetromino(id, SPAWN[id], COLORS[id])
+
+
+def test_empty_board():
+    b = Board(10, 22)
+    expected = {"O": 9, "I": 17, "J": 34, "L": 34, "S": 17, "Z": 17, "T": 34}
+    for id, count in expected.items():
+        set_tetromino(b, id)
+        placements = get_placements(b)
+        assert len(placements) == count
+        for placement in placements:
+            ys = [placement.y + dy for dx, dy in ROTATIONS[id][placement.state]]
+            assert min(ys) == 0
+
+
+def test_tuck():
+    b = Board(10, 22)
+    # an overhang over columns 0 and 1, with an empty space under it
+    for i in range(4, 10):
+        b.board_tetrominos_matrix.fill(i, 0)
+    for i in range(0, 10):
+        b.board_tetrominos_matrix.fill(i, 2)
+    b.board_tetrominos_matrix.unfill(2, 2)
+    b.board_tetrominos_matrix.unfill(3, 2)
+    set_tetromino(b, "O")
+    assert Placement(0, 0, 0) in get_placements(b)
+    actions = get_actions(b, Placement(0, 0, 0))
+    assert actions[-3:] == [Action.LEFT, Action.LEFT, Action.HARD_DROP]
+
+
+def test_get_actions():
+    e = Engine()
+    set_tetromino(e.board, "T")
+    for placement in get_placements(e.board):
+        e = Engine()
+        set_tetromino(e.board, "T")
+        for action in get_actions(e.board, placement):
+            e.step(action)
+        squares = sorted((s.x, s.y) for s in e.board.board_tetrominos_squares)
+        assert squares == sorted(
+            (placement.x + dx, placement.y + dy)
+            for dx, dy in ROTATIONS["T"][placement.state])
+
+
+def test_blocked():
+    b = Board(10, 22)
+    set_tetromino(b, "I")
+    for i in range(10):
+        b.board_tetrominos_matrix.fill(i, 20)
+    assert get_placements(b) == []
+    assert get_actions(b, Placement(0, 0, 0)) is None
@@ -0,0 +1,62 @@
+"""Preview of the current tetromino's landing position."""
+import logging
+
+from src.colors import colors
+from src.point.point import Point
+from src.square.square import Square
+
+log = logging.getLogger(__name__)
+
+
+class Ghost:
+    """
+    A ghost shows where the current tetromino would land if hard dropped.
+
+    The ghost shares the current tetromino's squares and only keeps the
+    distance it is moved down by, which is recomputed when the tetromino's
+    position or rotation or the board's stack changes.
+    """
+
+    def __init__(self, board):
+        """
+        Initialize a Ghost object.
+
+        Args:
+            board (Board): The board containing the tetromino to follow.
+        """
+        self.board = board
+        self.key = None
+        self.drop_distance = 0
+
+    @property
+    def distance(self):
+        """
+        Get the distance between the current tetromino and the ghost.
+
+        Returns:
+            int: The number of units the ghost is below the tetromino.
+
+        """
+        tetromino = self.board.current_tetromino
+        key = (tetromino, tetromino.origin.x, tetromino.origin.y,
+               tetromino.state, self.board.stack_version)
+        if key != self.key:
+            self.key = key
+            self.drop_distance = \
+                self.board.board_tetrominos_matrix.drop_distance(
+                    tetromino.squares)
+        return self.drop_distance
+
+    @property
+    def squares(self):
+        """
+        Build the squares of the ghost.
+
+        Returns:
+            squares ([]Square): the four squares as a list.
+
+        """
+        distance = self.distance
+        return [Square(Point(square.x, square.y - distance), colors.ASH)
+                for square in self.board.current_tetromino.squares]
+
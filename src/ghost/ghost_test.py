@@ -0,0 +1,44 @@
+from src.board.board import Board
+from src.colors import colors
+from src.movement.movement import Movement
+from src.point.point import Point
+from src.tetromino.constants import COLORS, SPAWN
+from src.tetromino.tetromino import Tetromino
+
+
+def get_list_tuples(squares):
+    return [(square.x, square.y) for square in squares]
+
+
+def test_squares():
+    b = Board(10, 22)
+    b.current_tetromino = Tetromino("I", SPAWN["I"], COLORS["I"])
+    ghost = b.get_ghost_tetromino()
+    assert ghost.distance == 20
+    assert get_list_tuples(ghost.squares) == [(3, 0), (4, 0), (5, 0), (6, 0)]
+    for square in ghost.squares:
+        assert square.color == colors.ASH
+    for square in b.current_tetromino.squares:
+        assert square.color == COLORS["I"]
+
+
+def test_follows_current_tetromino():
+    b = Board(10, 22)
+    m = Movement(b)
+    b.current_tetromino = Tetromino("O", SPAWN["O"], COLORS["O"])
+    ghost = b.get_ghost_tetromino()
+    m.move_left()
+    assert get_list_tuples(ghost.squares) == [(3, 0), (4, 0), (4, 1), (3, 1)]
+    m.move_down()
+    assert ghost.distance == 19
+
+
+def test_follows_stack():
+    b = Board(10, 22)
+    b.current_tetromino = Tetromino("O", SPAWN["O"], COLORS["O"])
+    ghost = b.get_ghost_tetromino()
+    assert ghost.distance == 20
+    b.current_tetromino = Tetromino("O", Point(4, 0), COLORS["O"])
+    b.lock_current_tetromino()
+    b.current_tetromino = Tetromino("O", SPAWN["O"], COLORS["O"])
+    assert ghost.distance == 18
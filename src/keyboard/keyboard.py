@@ -4,21 +4,46 @@ import logging
 import pyglet
 from pyglet.window import key
 
+from src import config
+from src.engine.action import Action
+
 log = logging.getLogger(__name__)
 
+# The action triggered by each key
+KEYS = {
+    key.LEFT: Action.LEFT,
+    key.RIGHT: Action.RIGHT,
+    key.DOWN: Action.DOWN,
+    key.UP: Action.ROTATE_CW,
+    key.Z: Action.ROTATE_CCW,
+    key.SPACE: Action.HARD_DROP,
+    key.LSHIFT: Action.HOLD,
+    key.RSHIFT: Action.HOLD,
+    key.C: Action.HOLD,
+}
+
 
 class Keyboard:
     """Keyboard handles all the key presses in the game."""
 
-    def __init__(self, movement):
+    def __init__(self, engine, bot=None, profiler=None, scheduler=None):
         """
         Initialize a Keyboard object.
 
         Args:
-            movement (Movement): The game's movement handler.
+            engine (Engine): The game's engine.
+            bot (Bot): The bot playing in autoplay mode, None to disable it.
+            profiler (Profiler): Records the latency of the key presses,
+                None to disable it.
+            scheduler (Scheduler): Soft drops while the down key is held,
+                None to disable it.
         """
         log.info("Initializing keyboard")
-        self.movement = movement
+        self.engine = engine
+        self.bot = bot
+        self.profiler = profiler
+        self.scheduler = scheduler
+        self.autoplay = False
 
     def on_key_press(self, symbol, modifier):
         """
@@ -28,21 +53,45 @@ class Keyboard:
             symbol (int): A virtual key code, constants defined in `pyglet.window.key`.
             modifier (int): A modifer key, constants defined in `pyglet.window.key`.
         """
-        if symbol == key.LEFT:
-            self.movement.move_left()
-        elif symbol == key.RIGHT:
-            self.movement.move_right()
-        elif symbol == key.DOWN:
-            self.movement.move_down()
-        elif symbol == key.UP:
-            self.movement.rotate_cw()
-        elif symbol == key.Z:
-            self.movement.rotate_ccw()
-        elif symbol == key.SPACE:
-            self.movement.hard_drop()
-        elif symbol == key.LSHIFT or \
-                symbol == key.RSHIFT or \
-                symbol == key.C:
-            self.movement.board.hold_current_tetromino()
+        if symbol == key.A and self.bot is not None:
+            self.toggle_autoplay()
+        elif symbol in KEYS and not self.autoplay:
+            if self.profiler is not None:
+                self.profiler.press()
+            self.engine.step(KEYS[symbol])
+            if symbol == key.DOWN and self.scheduler is not None:
+                self.scheduler.soft_drop = True
         elif symbol == key.ESCAPE:
             pyglet.app.exit()
+
+    def on_key_release(self, symbol, modifier):
+        """
+        Override pyglet's on_key_release function to stop soft dropping.
+
+        Args:
+            symbol (int): A virtual key code, constants defined in `pyglet.window.key`.
+            modifier (int): A modifer key, constants defined in `pyglet.window.key`.
+        """
+        if symbol == key.DOWN and self.scheduler is not None:
+            self.scheduler.soft_drop = False
+
+    def toggle_autoplay(self):
+        """Start or stop letting the bot play the game."""
+        self.autoplay = not self.autoplay
+        log.info("Autoplay %s", "on" if self.autoplay else "off")
+        if self.autoplay:
+            # Configurations written before autoplay don't set its speed
+            rate = getattr(config, "AUTOPLAY_PIECES_PER_SECOND", 60)
+            pyglet.clock.schedule_interval(self.play, 1 / rate)
+        else:
+            pyglet.clock.unschedule(self.play)
+
+    def play(self, dt):
+        """
+        Let the bot place the current tetromino, scheduled during autoplay.
+
+        Args:
+            dt (float): The time elapsed since the last call.
+        """
+        if not self.bot.play(self.engine):
+            self.toggle_autoplay()
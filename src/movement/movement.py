@@ -1,7 +1,8 @@
 """Tetromino movement handler."""
 import logging
 
-from src.tetromino.constants import WALL_KICKS_CCW, WALL_KICKS_CW
+from src.tetromino.constants import CCW, CW, ROTATIONS, WALL_KICKS
+from src.trace.trace import Event, tracer
 
 log = logging.getLogger(__name__)
 
@@ -20,134 +21,105 @@ class Movement:
 
     def move_left(self):
         """Move the current tetromino one unit left if it is moveable."""
-        moveable = True
-        for square in self.board.current_tetromino.squares:
-            if square.x <= 0 or self.board.board_tetrominos_matrix[square.x - 1][square.y] != 0:
-                moveable = False
-                break
-        if moveable:
+        if not self.board.board_tetrominos_matrix.collides(
+                self.board.current_tetromino.squares, -1, 0):
             log.debug("Moving current tetromino left")
             self.board.current_tetromino.offset(-1, 0)
-            self.board.ghost_tetromino = self.board.get_ghost_tetromino()
+            self.board.version += 1
+            if tracer.enabled:
+                tracer.record(Event.MOVE, -1, 0)
 
     def move_right(self):
         """Move the current tetromino one unit right if it is moveable."""
-        moveable = True
-
-        for square in self.board.current_tetromino.squares:
-            if square.x + 1 >= self.board.width or \
-                    self.board.board_tetrominos_matrix[square.x + 1][square.y] != 0:
-                moveable = False
-                break
-        if moveable:
+        if not self.board.board_tetrominos_matrix.collides(
+                self.board.current_tetromino.squares, 1, 0):
             log.debug("Moving current tetromino right")
             self.board.current_tetromino.offset(1, 0)
-            self.board.ghost_tetromino = self.board.get_ghost_tetromino()
+            self.board.version += 1
+            if tracer.enabled:
+                tracer.record(Event.MOVE, 1, 0)
 
     def move_down(self):
         """Move the current tetromino one unit down if it is moveable."""
-        moveable = True
-        for square in self.board.current_tetromino.squares:
-            if square.y <= 0 or self.board.board_tetrominos_matrix[square.x][square.y - 1] != 0:
-                moveable = False
-                break
-        if moveable:
+        if not self.board.board_tetrominos_matrix.collides(
+                self.board.current_tetromino.squares, 0, -1):
             log.debug("Moving current tetromino down")
             self.board.current_tetromino.offset(0, -1)
-            self.board.ghost_tetromino = self.board.get_ghost_tetromino()
+            self.board.version += 1
+            if tracer.enabled:
+                tracer.record(Event.MOVE, 0, -1)
 
     def move_up(self):
         """Move the current tetromino one unit up if it is moveable."""
-        moveable = True
-        for square in self.board.current_tetromino.squares:
-            if square.y < self.board.height or self.board.matrix[square.x][square.y + 1] != 0:
-                moveable = False
-                break
-        if moveable:
+        if not self.board.board_tetrominos_matrix.collides(
+                self.board.current_tetromino.squares, 0, 1):
             log.debug("Moving current tetromino up")
             self.board.current_tetromino.offset(0, 1)
-            self.board.ghost_tetromino = self.board.get_ghost_tetromino()
+            self.board.version += 1
+            if tracer.enabled:
+                tracer.record(Event.MOVE, 0, 1)
 
     def rotate_cw(self):
         """Rotate a tetromino clockwise, corrected to boundaries and other tetrominos."""
-        if self.board.current_tetromino.id == "O":
-            log.debug("Tetromino \"O\" detected, skipping")
-            return
-
-        self.board.current_tetromino.rotate_cw()
-        # https://stackoverflow.com/questions/2974022
-        for i, p in enumerate(next(v for k, v in WALL_KICKS_CW.items() if self.board.current_tetromino.id in k)
-                              [self.board.current_tetromino.state.value]):
-            if self.wall_kick_test_pass(p[0], p[1]):
-                log.debug("Clockwise rotation wall kick passed Test #{} "
-                          "with offset ({}, {})".format(i + 1, p[0], p[1]))
-                self.board.ghost_tetromino = self.board.get_ghost_tetromino()
-                return
-
-        # if it reaches here that means all tests have failed, so rotate back
-        self.board.current_tetromino.rotate_ccw()
-        log.debug("All clockwise rotation wall kicks failed, not rotating")
+        self.rotate(CW)
 
     def rotate_ccw(self):
         """Rotate a tetromino counterclockwise,
            corrected to boundaries and other tetrominos."""
-        if self.board.current_tetromino.id == "O":
+        self.rotate(CCW)
+
+    def rotate(self, direction):
+        """
+        Rotate a tetromino in the given direction, using the first wall kick
+        test whose resulting position is free.
+
+        Args:
+            direction (int): The direction of the rotation (CW or CCW).
+        """
+        tetromino = self.board.current_tetromino
+        if tetromino.id == "O":
             log.debug("Tetromino \"O\" detected, skipping")
             return
 
-        self.board.current_tetromino.rotate_ccw()
-        # https://stackoverflow.com/questions/2974022
-        for i, p in enumerate(next(v for k, v in WALL_KICKS_CCW.items() if self.board.current_tetromino.id in k)
-                              [self.board.current_tetromino.state.value]):
-            if self.wall_kick_test_pass(p[0], p[1]):
-                log.debug("Counterclockwise rotation wall kick passed Test "
-                          "#{} with offset ({}, {})".format(i + 1, p[0], p[1]))
-                self.board.ghost_tetromino = self.board.get_ghost_tetromino()
+        state = tetromino.state.next() if direction == CW else \
+            tetromino.state.prev()
+        layout = ROTATIONS[tetromino.id][state.value]
+        wall_kicks = WALL_KICKS[(tetromino.id, tetromino.state.value, direction)]
+        for i, (x, y) in enumerate(wall_kicks):
+            if not self.board.board_tetrominos_matrix.collides_layout(
+                    layout, tetromino.origin.x + x, tetromino.origin.y + y):
+                log.debug("Rotation (direction=%s) wall kick passed Test #%s "
+                          "with offset (%s, %s)", direction, i + 1, x, y)
+                tetromino.state = state
+                tetromino.offset(x, y)
+                tetromino.update_squares()
+                self.board.version += 1
+                if tracer.enabled:
+                    tracer.record(Event.ROTATE, direction, i)
                 return
 
-        # if it reaches here that means all tests have failed, so rotate back
-        self.board.current_tetromino.rotate_cw()
-        log.debug("All clockwise rotation wall kicks failed, not rotating")
+        log.debug("All rotation (direction=%s) wall kicks failed, "
+                  "not rotating", direction)
+        if tracer.enabled:
+            tracer.record(Event.ROTATE, direction, -1)
 
-    def wall_kick_test_pass(self, x, y):
+    def hard_drop(self):
         """
-        Perform a wall kick test to determine the resulting position
-        after a rotation.
-
-        Args:
-            x (int): The x coordinate of the position being tested.
-            y (int): The y coordinate of the position being tested.
+        Move a tetromino down by the lowest difference and lock it in place.
 
         Returns:
-            bool: Whether or not the wall kick test passed.
+            int: The number of lines cleared.
 
         """
-        self.board.current_tetromino.offset(x, y)
-        for square in self.board.current_tetromino.squares:
-            if square.x < 0 or square.x >= self.board.width or \
-                square.y < 0 or square.y >= self.board.height or \
-                    self.board.board_tetrominos_matrix[square.x][square.y] == 1:
-                self.board.current_tetromino.offset(-x, -y)
-                return False
-        return True
-
-    def hard_drop(self):
-        """Move a tetromino down by the lowest difference."""
         log.info("Hard dropping current tetromino")
-        for i in range(self.board.height):
-            self.board.current_tetromino.offset(0, -1)
-            for square in self.board.current_tetromino.squares:
-                if (square.y < 0 or self.board.board_tetrominos_matrix
-                        [square.x][square.y] == 1):
-                    self.board.current_tetromino.offset(0, 1)
-                    break
-
-        for square in self.board.current_tetromino.squares:
-            self.board.board_tetrominos_squares.append(square)
+        self.board.current_tetromino.offset(
+            0, -self.board.board_tetrominos_matrix.drop_distance(
+                self.board.current_tetromino.squares))
 
+        self.board.lock_current_tetromino()
         self.board.switch_current_tetromino()
         self.board.holdable = True
         filled_indices = self.board.get_filled_indices()
         self.board.clear_lines(filled_indices)
         self.board.drop_lines(filled_indices)
-        self.board.ghost_tetromino = self.board.get_ghost_tetromino()
+        return len(filled_indices)
@@ -0,0 +1,80 @@
+from src.board.board import Board
+from src.movement.movement import Movement
+from src.point.point import Point
+from src.tetromino.constants import CCW, COLORS, CW, SPAWN, WALL_KICKS
+from src.tetromino.state import State
+from src.tetromino.tetromino import Tetromino
+
+
+def get_list_tuples(squares):
+    return sorted((square.x, square.y) for square in squares)
+
+
+def test_wall_kicks_index():
+    for id in ["I", "J", "L", "S", "T", "Z"]:
+        for state in range(4):
+            for direction in [CW, CCW]:
+                assert len(WALL_KICKS[(id, state, direction)]) == 5
+    assert WALL_KICKS[("I", 0, CW)][1] == (-2, 0)
+    assert WALL_KICKS[("T", 0, CW)][1] == (-1, 0)
+    assert WALL_KICKS[("T", 0, CCW)][1] == (+1, 0)
+
+
+def test_rotate_cw():
+    b = Board(10, 22)
+    m = Movement(b)
+    b.current_tetromino = Tetromino("T", Point(3, 10), COLORS["T"])
+    m.rotate_cw()
+    assert b.current_tetromino.state == State.ONE
+    assert get_list_tuples(b.current_tetromino.squares) == \
+        [(4, 9), (4, 10), (4, 11), (5, 10)]
+
+
+def test_rotate_ccw_wall_kick():
+    b = Board(10, 22)
+    m = Movement(b)
+    # vertical J against the left wall, rotating back to spawn state
+    # overlaps the wall so the second test (+1, 0) is used
+    b.current_tetromino = Tetromino("J", Point(-1, 10), COLORS["J"])
+    b.current_tetromino.rotate_cw()
+    assert min(square.x for square in b.current_tetromino.squares) == 0
+    m.rotate_ccw()
+    assert b.current_tetromino.state == State.ZERO
+    assert (b.current_tetromino.origin.x, b.current_tetromino.origin.y) == \
+        (0, 10)
+    assert get_list_tuples(b.current_tetromino.squares) == \
+        [(0, 10), (0, 11), (1, 10), (2, 10)]
+
+
+def test_rotate_blocked():
+    b = Board(10, 22)
+    m = Movement(b)
+    for i in range(10):
+        for j in range(6):
+            if i != 4:
+                b.board_tetrominos_matrix.fill(i, j)
+    b.current_tetromino = Tetromino("I", Point(2, 3), COLORS["I"])
+    b.current_tetromino.rotate_cw()
+    before = get_list_tuples(b.current_tetromino.squares)
+    assert before == [(4, 1), (4, 2), (4, 3), (4, 4)]
+    m.rotate_cw()
+    assert b.current_tetromino.state == State.ONE
+    assert get_list_tuples(b.current_tetromino.squares) == before
+
+
+def test_rotate_o():
+    b = Board(10, 22)
+    m = Movement(b)
+    b.current_tetromino = Tetromino("O", SPAWN["O"], COLORS["O"])
+    m.rotate_cw()
+    assert b.current_tetromino.state == State.ZERO
+
+
+def test_hard_drop():
+    b = Board(10, 22)
+    m = Movement(b)
+    b.current_tetromino = Tetromino("I", SPAWN["I"], COLORS["I"])
+    m.hard_drop()
+    assert get_list_tuples(b.board_tetrominos_squares) == \
+        [(3, 0), (4, 0), (5, 0), (6, 0)]
+    assert b.holdable
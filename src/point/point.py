@@ -7,6 +7,8 @@ log = logging.getLogger(__name__)
 class Point:
     """A point is a coordinate on the board with an x and y position."""
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         """
         Initialize a Point object.
@@ -0,0 +1,120 @@
+"""Frame time and input latency measurements."""
+import csv
+import logging
+import time
+from collections import OrderedDict, deque
+
+log = logging.getLogger(__name__)
+
+# The parts of a frame that are timed, in the order they happen
+SECTIONS = ("stack", "ghost", "tetromino", "background", "batch", "frame")
+INPUT = "input"
+
+
+def percentile(values, fraction):
+    """
+    Find a percentile of some values with the nearest rank method.
+
+    Args:
+        values (list float): The values.
+        fraction (float): The percentile as a fraction (0.99 = p99).
+
+    Returns:
+        float: The percentile, None if there are no values.
+
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+class Profiler:
+    """
+    Profiler records the time spent in each part of the recent frames and
+    the latency from each key press to the next presented frame.
+
+    Only the most recent samples are kept, so the profiler can stay on.
+    """
+
+    def __init__(self, samples=1000):
+        """
+        Initialize a Profiler object.
+
+        Args:
+            samples (int): The number of recent samples kept per measurement.
+        """
+        self.clock = time.perf_counter
+        self.samples = OrderedDict(
+            (name, deque(maxlen=samples)) for name in SECTIONS + (INPUT,))
+        self.presses = []
+
+    def add(self, name, seconds):
+        """
+        Record the time spent in a part of the current frame.
+
+        Args:
+            name (string): The part of the frame, one of SECTIONS.
+            seconds (float): The time spent.
+        """
+        self.samples[name].append(seconds)
+
+    def press(self):
+        """Record a key press, waiting for the frame that shows its result."""
+        self.presses.append(self.clock())
+
+    def present(self):
+        """Record the latency of the key presses shown by a new frame."""
+        if self.presses:
+            now = self.clock()
+            self.samples[INPUT].extend(now - t for t in self.presses)
+            self.presses = []
+
+    def get_stats(self):
+        """
+        Get the p50 and p99 of every measurement.
+
+        Returns:
+            OrderedDict: The (p50, p99) in milliseconds of each measurement,
+            None for the measurements without samples.
+
+        """
+        stats = OrderedDict()
+        for name, values in self.samples.items():
+            if values:
+                stats[name] = (percentile(values, 0.5) * 1000,
+                               percentile(values, 0.99) * 1000)
+            else:
+                stats[name] = None
+        return stats
+
+    def get_text(self):
+        """
+        Get the statistics as text for the overlay.
+
+        Returns:
+            string: A line with the p50 and p99 of every measurement.
+
+        """
+        lines = ["{:<11}{:>8}{:>8}".format("ms", "p50", "p99")]
+        for name, stats in self.get_stats().items():
+            if stats is None:
+                lines.append("{:<11}{:>8}{:>8}".format(name, "-", "-"))
+            else:
+                lines.append("{:<11}{:>8.2f}{:>8.2f}".format(name, *stats))
+        return "\n".join(lines)
+
+    def export(self, path):
+        """
+        Write every recorded sample to a CSV file.
+
+        Args:
+            path (string): The path of the CSV file.
+        """
+        log.info("Exporting profile to %s", path)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["measurement", "sample", "milliseconds"])
+            for name, values in self.samples.items():
+                for i, value in enumerate(values):
+                    writer.writerow([name, i, "{:.4f}".format(value * 1000)])
@@ -0,0 +1,47 @@
+import csv
+
+from src.profiler.profiler import INPUT, Profiler, percentile
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 51
+    assert percentile(values, 0.99) == 100
+    assert percentile([3], 0.99) == 3
+    assert percentile([], 0.5) is None
+
+
+def test_press_present():
+    profiler = Profiler()
+    times = iter([1.0, 1.5, 2.0])
+    profiler.clock = lambda: next(times)
+    profiler.press()
+    profiler.press()
+    profiler.present()
+    assert list(profiler.samples[INPUT]) == [1.0, 0.5]
+    profiler.present()
+    assert len(profiler.samples[INPUT]) == 2
+
+
+def test_samples_limit():
+    profiler = Profiler(samples=3)
+    for i in range(5):
+        profiler.add("frame", i)
+    assert list(profiler.samples["frame"]) == [2, 3, 4]
+
+
+def test_stats_export(tmpdir):
+    profiler = Profiler()
+    profiler.add("frame", 0.002)
+    profiler.add("frame", 0.004)
+    stats = profiler.get_stats()
+    assert stats["frame"] == (4.0, 4.0)
+    assert stats["stack"] is None
+    assert "frame" in profiler.get_text()
+
+    path = str(tmpdir.join("profile.csv"))
+    profiler.export(path)
+    with open(path) as f:
+        rows = list(csv.reader(f))
+    assert rows == [["measurement", "sample", "milliseconds"],
+                    ["frame", "0", "2.0000"], ["frame", "1", "4.0000"]]
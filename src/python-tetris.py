@@ -3,17 +3,33 @@ import logging
 
 import pyglet
 
+from src import config
 from src.config import LOG_LEVEL, UNIT
+from src.trace.trace import tracer
 from src.window.window import Window
 
 logging.basicConfig(level=LOG_LEVEL,
                     format="%(asctime)s\t%(name)s\t%(levelname)s\t%(message)s")
 log = logging.getLogger(__name__)
 
+# Settings added after the first configurations, with their defaults
+TRACE_FILE = getattr(config, "TRACE_FILE", None)
+REPLAY_FILE = getattr(config, "REPLAY_FILE", None)
+
 if __name__ == '__main__':
     log.info("Starting python-tetris")
-    log.info("Log level: {}".format(LOG_LEVEL))
+    log.info("Log level: %s", LOG_LEVEL)
+    if TRACE_FILE is not None:
+        tracer.enable()
     window = Window(10 * UNIT, 22 * UNIT, "Python Tetris")
     log.info("Entering main loop")
     pyglet.app.run()
     log.info("Exiting main loop")
+    if TRACE_FILE is not None:
+        log.info("Writing trace to %s", TRACE_FILE)
+        with open(TRACE_FILE, "w") as f:
+            tracer.dump(f)
+    if REPLAY_FILE is not None:
+        log.info("Writing replay to %s", REPLAY_FILE)
+        with open(REPLAY_FILE, "wb") as f:
+            f.write(window.recorder.finish().encode())
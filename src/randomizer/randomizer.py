@@ -1,16 +1,83 @@
 """Random tetromino generator."""
-from random import shuffle
+import random
 
-from src.tetromino.constants import COLORS, LAYOUTS, SPAWN
+from src.tetromino.constants import COLORS, IDS, SPAWN
 from src.tetromino.tetromino import Tetromino
 
+BAG_SIZE = len(IDS)
+
 
 class Randomizer:
-    """Randomizer handles the order of upcoming tetrominos in the game."""
+    """
+    Randomizer handles the order of upcoming tetrominos in the game.
+
+    The order is made of bags containing each tetromino once. Bags are
+    generated in bulk into a queue of tetromino numbers (indices of `IDS`),
+    so upcoming tetrominos can be previewed without creating Tetromino
+    objects until one is actually taken out.
+    """
+
+    def __init__(self, seed=None, rng=None, bags=16):
+        """
+        Initialize a Randomizer object.
+
+        Args:
+            seed (int): The seed of the random order, None for a random seed.
+            rng (Random): The random number generator to use instead of one
+                created from the seed.
+            bags (int): The number of bags generated at once.
+        """
+        self.random = rng or random.Random(seed)
+        self.bags = bags
+        self.queue = bytearray()
+        # The index in the queue of the next tetromino and the number of
+        # tetrominos taken out before the start of the queue
+        self.index = 0
+        self.taken = 0
+        self.new_bags()
+
+    @property
+    def list(self):
+        """
+        Get the tetrominos left in the bag currently being taken from.
+
+        Returns:
+            list (string): The identifiers of the tetrominos left in the bag.
+
+        """
+        position = self.taken + self.index
+        if position == 0:
+            end = BAG_SIZE
+        else:
+            end = -(-position // BAG_SIZE) * BAG_SIZE
+        return [IDS[i] for i in self.queue[self.index:end - self.taken]]
+
+    def new_bags(self):
+        """Append new random bags to the queue, dropping the used ones."""
+        used = self.index - self.index % BAG_SIZE
+        del self.queue[:used]
+        self.index -= used
+        self.taken += used
+        bag = list(range(BAG_SIZE))
+        for i in range(self.bags):
+            self.random.shuffle(bag)
+            self.queue.extend(bag)
+        # Everything but the index only changes here, so it is saved once
+        # per refill and shared by the snapshots taken until the next one
+        self.saved = (self.random.getstate(), bytes(self.queue), self.taken)
+
+    def next_id(self):
+        """
+        Take the next tetromino's identifier out of the queue.
+
+        Returns:
+            string: The identifier of the next tetromino.
 
-    def __init__(self):
-        """Initialize a Randomizer object with a list of keys."""
-        self.new_list()
+        """
+        if self.index == len(self.queue):
+            self.new_bags()
+        self.index += 1
+        return IDS[self.queue[self.index - 1]]
 
     def next(self):
         """
@@ -20,18 +87,48 @@ class Randomizer:
             Tetromino: The tetromino selected to be next.
 
         """
-        if len(self.list) == 0:
-            self.new_list()
-        next_tetromino_id = self.list.pop()
+        next_tetromino_id = self.next_id()
         return Tetromino(
             next_tetromino_id,
             SPAWN[next_tetromino_id],
             COLORS[next_tetromino_id],
         )
 
-    def new_list(self):
-        """Create a new random list of keys."""
-        self.list = []
-        for k in list(LAYOUTS.keys()):
-            self.list.append(k)
-        shuffle(self.list)
+    def snapshot(self):
+        """
+        Save the state of the tetromino order.
+
+        Returns:
+            tuple: The immutable state of the randomizer.
+
+        """
+        return self.saved, self.index
+
+    def restore(self, snapshot):
+        """
+        Restore a state saved by `snapshot`.
+
+        Args:
+            snapshot (tuple): The state of the randomizer.
+        """
+        saved, self.index = snapshot
+        if saved is not self.saved:
+            state, queue, self.taken = saved
+            self.random.setstate(state)
+            self.queue = bytearray(queue)
+            self.saved = saved
+
+    def peek(self, n):
+        """
+        Get the identifiers of the upcoming tetrominos without taking them.
+
+        Args:
+            n (int): The number of upcoming tetrominos.
+
+        Returns:
+            list (string): The identifiers of the upcoming tetrominos.
+
+        """
+        while len(self.queue) - self.index < n:
+            self.new_bags()
+        return [IDS[i] for i in self.queue[self.index:self.index + n]]
@@ -1,3 +1,5 @@
+import random
+
 from src.randomizer.randomizer import Randomizer
 
 
@@ -17,3 +19,28 @@ def test_next():
         assert len(r.list) == i - 1
     n = r.next()
     assert len(r.list) == 6
+
+
+def test_seed():
+    a = Randomizer(42)
+    b = Randomizer(42)
+    for i in range(50):
+        assert a.next().id == b.next().id
+
+
+def test_peek():
+    r = Randomizer(1, bags=2)
+    upcoming = r.peek(40)
+    assert len(upcoming) == 40
+    for i in range(0, 35, 7):
+        assert sorted(upcoming[i:i + 7]) == sorted(["O", "I", "J", "L", "S", "Z", "T"])
+    assert r.peek(3) == upcoming[:3]
+    for i in range(40):
+        assert r.next_id() == upcoming[i]
+    assert len(r.list) == 2
+
+
+def test_rng():
+    a = Randomizer(rng=random.Random(5))
+    b = Randomizer(5)
+    assert a.peek(30) == b.peek(30)
@@ -2,37 +2,184 @@
 import pyglet
 
 from src import config
+from src.colors import colors
 
 
 class Renderer:
-    """Renderer handles drawing of colored squares at a given position."""
+    """
+    Renderer draws the contents of a board to the screen.
 
-    def __init__(self, x_pos, y_pos, color):
+    The background never changes, so it is uploaded once to its own static
+    batch and only rebuilt when the unit size or the board's dimensions
+    change. The other squares are kept in a dynamic batch where the locked
+    squares are only updated when the board's stack changes and the ghost
+    and current tetromino are updated in place, so a frame takes a handful
+    of draw calls.
+    """
+
+    def __init__(self, board, profiler=None):
         """
         Initialize a Renderer object.
 
         Args:
-            x_pos (int): The x coordinate of the square to be rendered.
-            y_pos (int): The y coorindate of the square to be rendered.
-        """
-        self.x = x_pos * config.UNIT
-        self.y = y_pos * config.UNIT
-        self.color = color
-
-    def draw(self):
-        """Create a vertex list with the square's position and color and draws it to the screen."""
-        vertex_list = pyglet.graphics.vertex_list(4, 'v2i', 'c3B')
-        vertex_list.vertices = [self.x, self.y,
-                                self.x + config.UNIT, self.y,
-                                self.x + config.UNIT, self.y + config.UNIT,
-                                self.x, self.y + config.UNIT]
-        vertex_list.colors = self.color * 4
-        vertex_list.draw(pyglet.gl.GL_TRIANGLE_FAN)
-        # The border uses the same vertices and a darker shade of
-        # the same color
-        border_color = [int(c * 0.8) for c in vertex_list.colors]
-        vertex_list.colors = [border_color[0],
-                              border_color[1],
-                              border_color[2]] * 4
-        pyglet.gl.glLineWidth(2)  # make it thicker
-        vertex_list.draw(pyglet.gl.GL_LINE_LOOP)
+            board (Board): The board to be rendered.
+            profiler (Profiler): Records the time spent in each part of a
+                frame, None to disable it.
+        """
+        self.board = board
+        self.profiler = profiler
+        self.layout = None
+        self.stack_version = None
+
+    def build(self):
+        """Create the batches for the current unit size and board size."""
+        board = self.board
+        self.layout = (config.UNIT, board.width, board.height)
+        self.stack_version = None
+
+        self.background_batch = pyglet.graphics.Batch()
+        background = [
+            (i, j, colors.CHARCOAL if i % 2 == j % 2 else colors.JET)
+            for i in range(board.width) for j in range(board.height)]
+        self.background = self.add_squares(
+            self.background_batch, 0, len(background), 'static')
+        self.set_squares(self.background, background)
+
+        self.batch = pyglet.graphics.Batch()
+        # Room for a full board, the unused squares are left degenerate
+        self.stack = self.add_squares(
+            self.batch, 0, board.width * board.height, 'dynamic')
+        self.ghost = self.add_squares(self.batch, 1, 4, 'stream')
+        self.tetromino = self.add_squares(self.batch, 2, 4, 'stream')
+
+    def add_squares(self, batch, order, count, usage):
+        """
+        Add the vertex lists for a layer of squares to a batch.
+
+        Args:
+            batch (Batch): The batch the layer is added to.
+            order (int): The drawing order of the layer in the batch.
+            count (int): The number of squares in the layer.
+            usage (string): The OpenGL buffer usage hint of the layer.
+
+        Returns:
+            tuple: The fill and border vertex lists of the layer.
+
+        """
+        fill = batch.add(
+            4 * count, pyglet.gl.GL_QUADS,
+            pyglet.graphics.OrderedGroup(2 * order),
+            'v2i/' + usage, 'c3B/' + usage)
+        border = batch.add(
+            8 * count, pyglet.gl.GL_LINES,
+            BorderGroup(2 * order + 1),
+            'v2i/' + usage, 'c3B/' + usage)
+        return fill, border
+
+    def set_squares(self, layer, squares):
+        """
+        Update the vertices and colors of a layer of squares in place.
+
+        Args:
+            layer (tuple): The fill and border vertex lists of the layer.
+            squares (list tuple): The (x, y, color) of every square.
+        """
+        fill, border = layer
+        unit = config.UNIT
+        fill_vertices = []
+        fill_colors = []
+        border_vertices = []
+        border_colors = []
+        for x, y, color in squares:
+            left = x * unit
+            bottom = round(y * unit)
+            right = left + unit
+            top = bottom + unit
+            fill_vertices.extend((left, bottom, right, bottom,
+                                  right, top, left, top))
+            fill_colors.extend(color * 4)
+            border_vertices.extend((left, bottom, right, bottom,
+                                    right, bottom, right, top,
+                                    right, top, left, top,
+                                    left, top, left, bottom))
+            # The border uses a darker shade of the same color
+            border_colors.extend([int(c * 0.8) for c in color] * 8)
+        unused = fill.get_size() // 4 - len(squares)
+        fill_vertices.extend([0] * 8 * unused)
+        fill_colors.extend([0] * 12 * unused)
+        border_vertices.extend([0] * 16 * unused)
+        border_colors.extend([0] * 24 * unused)
+        fill.vertices[:] = fill_vertices
+        fill.colors[:] = fill_colors
+        border.vertices[:] = border_vertices
+        border.colors[:] = border_colors
+
+    def update(self, offset=0.0):
+        """
+        Update the vertex lists to match the board.
+
+        Args:
+            offset (float): The fraction of a row the current tetromino is
+                drawn below its position, to show it falling between ticks.
+        """
+        board = self.board
+        profiler = self.profiler
+        if self.layout != (config.UNIT, board.width, board.height):
+            self.build()
+        if profiler is not None:
+            start = profiler.clock()
+        if self.stack_version != board.stack_version:
+            self.stack_version = board.stack_version
+            # Squares locked above the board when the game is over are
+            # outside the window and the layer only has room for the board
+            self.set_squares(self.stack, [
+                cell for cell in board.board_tetrominos_squares.cells()
+                if cell[1] < board.height])
+        if profiler is not None:
+            stack = profiler.clock()
+            profiler.add("stack", stack - start)
+
+        tetromino = board.current_tetromino
+        distance = board.ghost_tetromino.distance
+        self.set_squares(self.ghost, [
+            (square.x, square.y - distance, colors.ASH)
+            for square in tetromino.squares])
+        if profiler is not None:
+            ghost = profiler.clock()
+            profiler.add("ghost", ghost - stack)
+        self.set_squares(self.tetromino, [
+            (square.x, square.y - offset, tetromino.color)
+            for square in tetromino.squares])
+        if profiler is not None:
+            profiler.add("tetromino", profiler.clock() - ghost)
+
+    def draw(self, offset=0.0):
+        """
+        Draw the board to the screen.
+
+        Args:
+            offset (float): The fraction of a row the current tetromino is
+                drawn below its position.
+        """
+        self.update(offset)
+        profiler = self.profiler
+        if profiler is None:
+            self.background_batch.draw()
+            self.batch.draw()
+            return
+        start = profiler.clock()
+        self.background_batch.draw()
+        background = profiler.clock()
+        self.batch.draw()
+        profiler.add("background", background - start)
+        profiler.add("batch", profiler.clock() - background)
+
+
+class BorderGroup(pyglet.graphics.OrderedGroup):
+    """Drawing group for the square borders, drawn with thicker lines."""
+
+    def set_state(self):
+        pyglet.gl.glLineWidth(2)
+
+    def unset_state(self):
+        pyglet.gl.glLineWidth(1)
@@ -0,0 +1,183 @@
+"""Archive of many replays in a single file."""
+import mmap
+import os
+import struct
+
+from src.replay.replay import Replay, iter_states
+
+MAGIC = b"TRPA"
+VERSION = 2
+# Magic, version, reserved, number of replays, offset of the index
+HEADER = struct.Struct("<4sHHQQ")
+# Offset and size of a replay in the file
+ENTRY = struct.Struct("<QQ")
+
+
+class ArchiveWriter:
+    """
+    ArchiveWriter appends replays to an archive file.
+
+    An archive starts with a fixed size header followed by the encoded
+    replays, and ends with an index holding the offset and size of every
+    replay. New replays are written after the existing index, which stays
+    valid until the writer is closed and the extended index is written
+    after them. The header is updated last, so an archive whose writer
+    never closed still reads as it was before.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize an ArchiveWriter object, creating the archive if needed.
+
+        Args:
+            path (string): The path of the archive file.
+        """
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self.file = open(path, "r+b")
+            count, index_offset = read_header(self.file.read(HEADER.size))
+            self.file.seek(index_offset)
+            index = self.file.read(count * ENTRY.size)
+            self.entries = list(ENTRY.iter_unpack(index))
+            self.file.seek(0, os.SEEK_END)
+        else:
+            self.file = open(path, "w+b")
+            self.file.write(HEADER.pack(MAGIC, VERSION, 0, 0, HEADER.size))
+            self.entries = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(self, replay):
+        """
+        Append a replay to the archive.
+
+        Args:
+            replay (Replay): The replay to be appended.
+
+        Returns:
+            int: The index of the replay in the archive.
+
+        """
+        data = replay.encode()
+        self.entries.append((self.file.tell(), len(data)))
+        self.file.write(data)
+        return len(self.entries) - 1
+
+    def close(self):
+        """Write the index and header and close the archive file."""
+        if self.file.closed:
+            return
+        index_offset = self.file.tell()
+        self.file.write(b"".join(ENTRY.pack(*e) for e in self.entries))
+        # The index has to be on disk before the header points to it
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.seek(0)
+        self.file.write(
+            HEADER.pack(MAGIC, VERSION, 0, len(self.entries), index_offset))
+        self.file.close()
+
+
+class Archive:
+    """
+    Archive reads the replays of an archive file through a memory map.
+
+    Only the header is read when opening an archive. A replay is found by
+    reading its offset from the index, so any replay is reached directly
+    however large the archive is.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize an Archive object.
+
+        Args:
+            path (string): The path of the archive file.
+        """
+        with open(path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.count, self.index_offset = read_header(self.mmap)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, k):
+        """
+        Decode a replay.
+
+        Args:
+            k (int): The index of the replay.
+
+        Returns:
+            Replay: The replay.
+
+        """
+        return Replay.decode(self.get_bytes(k))
+
+    def __iter__(self):
+        for k in range(self.count):
+            yield self[k]
+
+    def get_bytes(self, k):
+        """
+        Get an encoded replay.
+
+        Args:
+            k (int): The index of the replay.
+
+        Returns:
+            bytes: The encoded replay.
+
+        """
+        if k < 0:
+            k += self.count
+        if k < 0 or k >= self.count:
+            raise IndexError("Replay index out of range: {}".format(k))
+        offset, size = ENTRY.unpack_from(
+            self.mmap, self.index_offset + k * ENTRY.size)
+        return self.mmap[offset:offset + size]
+
+    def iter_states(self, k, start=0):
+        """
+        Lazily re-simulate a replay, see `iter_states` in src.replay.replay.
+
+        Args:
+            k (int): The index of the replay.
+            start (int): The index of the first input yielded.
+
+        Returns:
+            iterator (tuple): The board's Snapshot before each input and
+            the input's Action.
+
+        """
+        return iter_states(self[k], start)
+
+    def close(self):
+        """Close the memory map."""
+        self.mmap.close()
+
+
+def read_header(data):
+    """
+    Read the header of an archive.
+
+    Args:
+        data (bytes): The start of the archive.
+
+    Returns:
+        tuple: The number of replays and the offset of the index.
+
+    """
+    magic, version, reserved, count, index_offset = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a version {} replay archive".format(VERSION))
+    return count, index_offset
@@ -0,0 +1,80 @@
+import pytest
+
+from src.engine.action import Action
+from src.engine.engine import Engine
+from src.replay.archive import Archive, ArchiveWriter
+from src.replay.replay import Replay, Result, play
+
+ACTIONS = [Action.LEFT, Action.ROTATE_CW, Action.HARD_DROP, Action.HOLD,
+           Action.RIGHT, Action.HARD_DROP]
+
+
+def get_replay(seed):
+    return Replay(seed, inputs=[(i * 3, a) for i, a in enumerate(ACTIONS)],
+                  result=Result(seed, 0, 0, 0))
+
+
+def test_write_read(tmpdir):
+    path = str(tmpdir.join("replays.trpa"))
+    with ArchiveWriter(path) as writer:
+        assert [writer.append(get_replay(seed)) for seed in range(5)] == \
+            list(range(5))
+    with Archive(path) as archive:
+        assert len(archive) == 5
+        assert archive[3] == get_replay(3)
+        assert archive[-1] == get_replay(4)
+        assert list(archive) == [get_replay(seed) for seed in range(5)]
+        with pytest.raises(IndexError):
+            archive[5]
+
+
+def test_append(tmpdir):
+    path = str(tmpdir.join("replays.trpa"))
+    with ArchiveWriter(path) as writer:
+        writer.append(get_replay(0))
+    with ArchiveWriter(path) as writer:
+        assert writer.append(get_replay(1)) == 1
+    with Archive(path) as archive:
+        assert list(archive) == [get_replay(0), get_replay(1)]
+
+
+def test_append_not_closed(tmpdir):
+    path = str(tmpdir.join("replays.trpa"))
+    with ArchiveWriter(path) as writer:
+        writer.append(get_replay(0))
+        writer.append(get_replay(1))
+    # a writer failing before it is closed leaves the archive as it was
+    writer = ArchiveWriter(path)
+    writer.append(get_replay(2))
+    writer.file.close()
+    with Archive(path) as archive:
+        assert list(archive) == [get_replay(0), get_replay(1)]
+    with ArchiveWriter(path) as writer:
+        assert writer.append(get_replay(3)) == 2
+    with Archive(path) as archive:
+        assert list(archive) == [get_replay(0), get_replay(1), get_replay(3)]
+
+
+def test_bad_archive(tmpdir):
+    path = tmpdir.join("replays.trpa")
+    path.write_binary(b"x" * 64)
+    with pytest.raises(ValueError):
+        Archive(str(path))
+
+
+def test_iter_states(tmpdir):
+    path = str(tmpdir.join("replays.trpa"))
+    replay = get_replay(9)
+    with ArchiveWriter(path) as writer:
+        writer.append(replay)
+    with Archive(path) as archive:
+        states = list(archive.iter_states(0))
+        assert [action for state, action in states] == ACTIONS
+        assert list(archive.iter_states(0, start=4)) == states[4:]
+
+    # each state is the board before its action
+    engine = Engine(seed=9)
+    for snapshot, action in states:
+        assert engine.board.snapshot() == snapshot
+        engine.step(action)
+    assert engine.board.get_hash() == play(replay).board.get_hash()
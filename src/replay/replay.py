@@ -0,0 +1,313 @@
+"""Compact game replays."""
+import argparse
+import logging
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from src.engine.action import Action
+from src.engine.engine import Engine
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"TRPL"
+VERSION = 2
+# Number of bits of an entry used by its action, the rest is its tick delta
+ACTION_BITS = 3
+ACTIONS = list(Action)
+
+# The outcome of a game, checked when a replay is verified
+Result = namedtuple("Result", ["pieces", "lines", "ticks", "hash"])
+
+
+def write_varint(buffer, value):
+    """
+    Append an unsigned integer to a buffer using 7 bits per byte.
+
+    Args:
+        buffer (bytearray): The buffer the value is appended to.
+        value (int): The value, at least 0.
+    """
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, position):
+    """
+    Read an unsigned integer written by write_varint.
+
+    Args:
+        data (bytes): The data the value is read from.
+        position (int): The index of the value's first byte.
+
+    Returns:
+        tuple: The value and the index of the byte following it.
+
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def get_result(engine):
+    """
+    Get the outcome of a game.
+
+    Args:
+        engine (Engine): The engine of the game.
+
+    Returns:
+        Result: The game's outcome.
+
+    """
+    return Result(engine.pieces, engine.lines, engine.ticks,
+                  engine.board.get_hash())
+
+
+class Replay:
+    """
+    A replay is a game stored as the seed of its tetromino order and the
+    inputs applied to it, with the engine tick at which each input happened.
+    Gravity and locking only depend on the ticks, so replaying the inputs
+    at their ticks re-simulates the game exactly.
+
+    Every input is stored as a single varint holding the action and the
+    ticks elapsed since the previous input, so most inputs take one byte.
+    """
+
+    def __init__(self, seed, width=10, height=22, inputs=None, result=None):
+        """
+        Initialize a Replay object.
+
+        Args:
+            seed (int): The seed of the game's tetromino order.
+            width (int): The board's width in number of units.
+            height (int): The board's height in number of units.
+            inputs (list tuple): The (tick, Action) of every input, in order.
+            result (Result): The game's outcome, None if it isn't known.
+        """
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.inputs = inputs if inputs is not None else []
+        self.result = result
+
+    def __eq__(self, other):
+        return isinstance(other, Replay) and \
+            (self.seed, self.width, self.height, self.inputs, self.result) == \
+            (other.seed, other.width, other.height, other.inputs, other.result)
+
+    def encode(self):
+        """
+        Encode the replay as bytes.
+
+        Returns:
+            bytes: The encoded replay.
+
+        """
+        buffer = bytearray(MAGIC)
+        buffer.append(VERSION)
+        for value in (self.seed, self.width, self.height, len(self.inputs)):
+            write_varint(buffer, value)
+        last = 0
+        for tick, action in self.inputs:
+            write_varint(buffer, (tick - last) << ACTION_BITS | action.value)
+            last = tick
+        buffer.append(self.result is not None)
+        if self.result is not None:
+            for value in self.result:
+                write_varint(buffer, value)
+        return bytes(buffer)
+
+    @classmethod
+    def decode(cls, data):
+        """
+        Decode a replay encoded by `encode`.
+
+        Args:
+            data (bytes): The encoded replay.
+
+        Returns:
+            Replay: The decoded replay.
+
+        """
+        if data[:len(MAGIC)] != MAGIC or data[len(MAGIC)] != VERSION:
+            raise ValueError("Not a version {} replay".format(VERSION))
+        position = len(MAGIC) + 1
+        values = []
+        for i in range(4):
+            value, position = read_varint(data, position)
+            values.append(value)
+        seed, width, height, count = values
+        inputs = []
+        tick = 0
+        for i in range(count):
+            value, position = read_varint(data, position)
+            tick += value >> ACTION_BITS
+            inputs.append((tick, ACTIONS[value & (1 << ACTION_BITS) - 1]))
+        result = None
+        if data[position]:
+            position += 1
+            values = []
+            for i in range(len(Result._fields)):
+                value, position = read_varint(data, position)
+                values.append(value)
+            result = Result(*values)
+        return cls(seed, width, height, inputs, result)
+
+
+class Recorder:
+    """
+    Recorder records the inputs applied to an engine as a replay.
+
+    An engine calls `record` for every action it applies once the recorder
+    is set as its `recorder`.
+    """
+
+    def __init__(self, engine, seed):
+        """
+        Initialize a Recorder object and start recording an engine's game.
+
+        Args:
+            engine (Engine): The engine of the game, created with the seed
+                and the default timings.
+            seed (int): The seed of the game's tetromino order.
+        """
+        self.engine = engine
+        self.replay = Replay(seed, engine.board.width, engine.board.height)
+        engine.recorder = self
+
+    def record(self, action):
+        """
+        Record an action applied to the engine.
+
+        Args:
+            action (Action): The applied action.
+        """
+        self.replay.inputs.append((self.engine.ticks, action))
+
+    def finish(self):
+        """
+        Stop recording and store the game's outcome.
+
+        Returns:
+            Replay: The recorded replay.
+
+        """
+        self.engine.recorder = None
+        self.replay.result = get_result(self.engine)
+        return self.replay
+
+
+def advance(engine, tick):
+    """
+    Tick an engine until it reaches a tick or its game is over.
+
+    Args:
+        engine (Engine): The engine to be ticked.
+        tick (int): The tick to be reached.
+    """
+    while engine.ticks < tick and not engine.game_over:
+        engine.tick()
+
+
+def play(replay):
+    """
+    Re-simulate a replay's game as fast as possible.
+
+    Args:
+        replay (Replay): The replay to be played.
+
+    Returns:
+        Engine: The engine at the end of the game.
+
+    """
+    engine = Engine(replay.width, replay.height, replay.seed)
+    step = engine.step
+    for tick, action in replay.inputs:
+        if tick > engine.ticks:
+            advance(engine, tick)
+        step(action)
+    if replay.result is not None:
+        advance(engine, replay.result.ticks)
+    return engine
+
+
+def iter_states(replay, start=0):
+    """
+    Lazily re-simulate a replay, yielding the state before each input.
+
+    The inputs before `start` are applied without building any state, so
+    seeking into a game only costs its re-simulation.
+
+    Args:
+        replay (Replay): The replay to be played.
+        start (int): The index of the first input yielded.
+
+    Returns:
+        iterator (tuple): The board's Snapshot before each input and the
+        input's Action.
+
+    """
+    engine = Engine(replay.width, replay.height, replay.seed)
+    for i, (tick, action) in enumerate(replay.inputs):
+        advance(engine, tick)
+        if i >= start:
+            yield engine.board.snapshot(), action
+        engine.step(action)
+
+
+def verify(replay):
+    """
+    Check that a replay leads to the outcome stored in it.
+
+    Args:
+        replay (Replay): The replay to be verified.
+
+    Returns:
+        bool: True if the re-simulated game ends with the stored outcome.
+
+    """
+    return replay.result is not None and \
+        get_result(play(replay)) == replay.result
+
+
+def verify_file(path):
+    """
+    Verify a replay stored in a file.
+
+    Args:
+        path (string): The path of the replay file.
+
+    Returns:
+        bool: Whether the replay is valid.
+
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        return verify(Replay.decode(data))
+    except (ValueError, IndexError):
+        log.warning("Replay %s is malformed", path)
+        return False
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    workers = args.workers or os.cpu_count()
+    with ProcessPoolExecutor(workers) as executor:
+        valid = list(executor.map(verify_file, args.paths, chunksize=16))
+    for path, result in zip(args.paths, valid):
+        print("{}\t{}".format(path, "valid" if result else "invalid"))
@@ -0,0 +1,59 @@
+import random
+
+from src.engine.action import Action
+from src.engine.engine import Engine
+from src.replay.replay import (Recorder, Replay, Result, play, read_varint,
+                               verify, write_varint)
+from src.runner.runner import random_policy
+
+
+def record_game(seed, pieces):
+    engine = Engine(seed=seed)
+    recorder = Recorder(engine, seed)
+    rng = random.Random(seed)
+    while not engine.game_over and engine.pieces < pieces:
+        for action in random_policy(engine, rng):
+            for i in range(rng.randrange(8)):
+                engine.tick()
+            engine.step(action)
+        for i in range(rng.randrange(40)):
+            engine.tick()
+    return engine, recorder.finish()
+
+
+def test_varint():
+    for value in [0, 1, 127, 128, 300, 1 << 63]:
+        buffer = bytearray()
+        write_varint(buffer, value)
+        assert read_varint(bytes(buffer) + b"\x05", 0) == (value, len(buffer))
+
+
+def test_encode_decode():
+    replay = Replay(1 << 40, 10, 22, [(0, Action.LEFT), (3, Action.HOLD),
+                                      (500, Action.HARD_DROP)],
+                    Result(1, 0, 900, 12345))
+    data = replay.encode()
+    assert Replay.decode(data) == replay
+    assert Replay.decode(Replay(7).encode()) == Replay(7)
+
+
+def test_record_verify():
+    engine, replay = record_game(5, 50)
+    assert engine.recorder is None
+    assert replay.result.pieces == engine.pieces
+    ticks = [tick for tick, action in replay.inputs]
+    assert ticks == sorted(ticks)
+    assert verify(Replay.decode(replay.encode()))
+    assert play(replay).board.get_hash() == engine.board.get_hash()
+    # about a byte per input since the inputs are a few ticks apart
+    assert len(replay.encode()) < len(replay.inputs) + 40
+
+
+def test_verify_tampered():
+    engine, replay = record_game(6, 20)
+    replay.inputs.insert(0, (0, Action.LEFT))
+    assert not verify(replay)
+    replay.inputs.pop(0)
+    assert verify(replay)
+    replay.result = replay.result._replace(lines=replay.result.lines + 1)
+    assert not verify(replay)
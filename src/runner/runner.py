@@ -0,0 +1,155 @@
+"""Parallel headless game runner."""
+import argparse
+import logging
+import os
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from src.engine.action import Action
+from src.engine.engine import Engine
+
+log = logging.getLogger(__name__)
+
+# Statistics of a single game, kept as a plain tuple so that it is cheap to
+# send back from the worker processes
+GameStats = namedtuple(
+    "GameStats", ["seed", "pieces", "lines", "holds", "moves", "time_per_move"])
+
+
+def random_policy(engine, rng):
+    """
+    Choose random moves for the current tetromino and hard drop it.
+
+    Args:
+        engine (Engine): The engine of the game being played.
+        rng (Random): The game's random number generator.
+
+    Returns:
+        list (Action): The actions to be applied.
+
+    """
+    actions = []
+    if engine.board.holdable and rng.random() < 0.1:
+        actions.append(Action.HOLD)
+    actions.extend([Action.ROTATE_CW] * rng.randrange(4))
+    shift = rng.randint(-5, 5)
+    actions.extend([Action.LEFT if shift < 0 else Action.RIGHT] * abs(shift))
+    actions.append(Action.HARD_DROP)
+    return actions
+
+
+def play_game(seed, max_pieces=1000, policy=random_policy):
+    """
+    Play a headless game until it is over or enough pieces were placed.
+
+    Args:
+        seed (int): The seed of the game's tetromino order and policy.
+        max_pieces (int): The number of pieces after which the game stops.
+        policy (function): Returns the actions for the current tetromino
+            given the engine and the game's random number generator.
+
+    Returns:
+        GameStats: The statistics of the game.
+
+    """
+    engine = Engine(seed=seed)
+    # A distinct seed so the policy's choices aren't correlated with the
+    # tetromino order
+    rng = random.Random((seed << 1) | 1)
+    moves = 0
+    start = time.perf_counter()
+    while not engine.game_over and engine.pieces < max_pieces:
+        for action in policy(engine, rng):
+            engine.step(action)
+            moves += 1
+    elapsed = time.perf_counter() - start
+    return GameStats(seed, engine.pieces, engine.lines, engine.holds, moves,
+                     elapsed / moves if moves else 0.0)
+
+
+def get_seeds(seed, count):
+    """
+    Derive the seeds of a series of games from a single seed.
+
+    Args:
+        seed (int): The seed of the series.
+        count (int): The number of games in the series.
+
+    Returns:
+        list (int): The seed of each game.
+
+    """
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for i in range(count)]
+
+
+def run_games(count, seed=0, max_pieces=1000, policy=random_policy,
+              workers=None):
+    """
+    Play games in parallel over a pool of processes.
+
+    Every game's seed only depends on the series' seed and the game's
+    index, so the results don't depend on the number of workers.
+
+    Args:
+        count (int): The number of games to be played.
+        seed (int): The seed of the series.
+        max_pieces (int): The number of pieces after which a game stops.
+        policy (function): The policy used in every game, which has to be
+            defined at the top level of a module so it can be pickled.
+        workers (int): The number of processes, None for one per CPU.
+
+    Returns:
+        list (GameStats): The statistics of each game, in order.
+
+    """
+    workers = workers or os.cpu_count()
+    seeds = get_seeds(seed, count)
+    chunksize = max(1, count // (workers * 4))
+    log.info("Running %s games on %s workers", count, workers)
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(play_game, seeds, repeat(max_pieces),
+                                 repeat(policy), chunksize=chunksize))
+
+
+def summarize(stats):
+    """
+    Aggregate the statistics of a series of games.
+
+    Args:
+        stats (list GameStats): The statistics of each game.
+
+    Returns:
+        dict: The totals and averages of the series.
+
+    """
+    games = len(stats)
+    moves = sum(s.moves for s in stats)
+    return {
+        "games": games,
+        "pieces": sum(s.pieces for s in stats),
+        "lines": sum(s.lines for s in stats),
+        "holds": sum(s.holds for s in stats),
+        "moves": moves,
+        "mean_pieces": sum(s.pieces for s in stats) / games if games else 0.0,
+        "mean_lines": sum(s.lines for s in stats) / games if games else 0.0,
+        "time_per_move": sum(s.time_per_move * s.moves for s in stats) / moves
+        if moves else 0.0,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-pieces", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    results = run_games(args.games, args.seed, args.max_pieces,
+                        workers=args.workers)
+    for key, value in summarize(results).items():
+        print("{}\t{}".format(key, value))
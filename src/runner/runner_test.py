@@ -0,0 +1,30 @@
+from src.runner.runner import get_seeds, play_game, run_games, summarize
+
+
+def without_time(stats):
+    return [s._replace(time_per_move=0) for s in stats]
+
+
+def test_get_seeds():
+    assert get_seeds(1, 10) == get_seeds(1, 10)
+    assert get_seeds(1, 10)[:5] == get_seeds(1, 5)
+    assert get_seeds(1, 10) != get_seeds(2, 10)
+
+
+def test_play_game():
+    a = play_game(7, max_pieces=30)
+    b = play_game(7, max_pieces=30)
+    assert a._replace(time_per_move=0) == b._replace(time_per_move=0)
+    assert 0 < a.pieces <= 30
+    assert a.moves >= a.pieces
+
+
+def test_run_games():
+    a = run_games(6, seed=3, max_pieces=20, workers=2)
+    b = run_games(6, seed=3, max_pieces=20, workers=3)
+    assert len(a) == 6
+    assert without_time(a) == without_time(b)
+    assert [s.seed for s in a] == get_seeds(3, 6)
+    totals = summarize(a)
+    assert totals["games"] == 6
+    assert totals["pieces"] == sum(s.pieces for s in a)
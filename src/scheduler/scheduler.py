@@ -0,0 +1,107 @@
+"""Fixed timestep game loop."""
+import logging
+
+import pyglet
+
+from src.engine.action import Action
+
+log = logging.getLogger(__name__)
+
+
+class Scheduler:
+    """
+    Scheduler advances an engine by fixed ticks as real time passes.
+
+    The scheduler is called by pyglet's clock once per tick interval. The
+    elapsed time is accumulated and spent in whole ticks, so the game logic
+    runs at the same rate whatever the display's refresh rate. The event
+    loop still wakes up on every tick, and pyglet 1.x dispatches on_draw
+    after each one, so the window skips the frames where neither the board
+    nor the falling tetromino moved. The time left over is used to
+    interpolate the falling tetromino between rows when rendering. When the
+    loop is so slow that too many ticks are due at once, the excess time is
+    dropped so the game slows down instead of falling further behind. Once
+    the game is over the scheduler stops so the event loop idles.
+    """
+
+    def __init__(self, engine, rate=60, max_ticks=5, soft_drop_ticks=2):
+        """
+        Initialize a Scheduler object.
+
+        Args:
+            engine (Engine): The engine to be ticked.
+            rate (int): The number of ticks per second.
+            max_ticks (int): The maximum number of ticks run per update.
+            soft_drop_ticks (int): The number of ticks between the rows the
+                current tetromino falls by while soft dropping.
+        """
+        self.engine = engine
+        self.step = 1 / rate
+        self.max_ticks = max_ticks
+        self.soft_drop_ticks = soft_drop_ticks
+        self.soft_drop = False
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self):
+        """
+        Get the fraction of the next tick that has elapsed.
+
+        Returns:
+            float: The elapsed fraction of the next tick, from 0 to 1.
+
+        """
+        return self.accumulator / self.step
+
+    def start(self):
+        """Start ticking the engine at the tick rate."""
+        self.accumulator = 0.0
+        pyglet.clock.schedule_interval(self.update, self.step)
+
+    def stop(self):
+        """Stop ticking the engine."""
+        pyglet.clock.unschedule(self.update)
+
+    def update(self, dt):
+        """
+        Run the ticks due after some time elapsed, stopping once the game
+        is over so the event loop idles.
+
+        Args:
+            dt (float): The time elapsed since the last call.
+        """
+        if self.engine.game_over:
+            self.stop()
+            return
+        self.accumulator += dt
+        ticks = 0
+        while self.accumulator >= self.step:
+            if ticks == self.max_ticks:
+                log.debug("Dropping %.3fs of ticks", self.accumulator)
+                self.accumulator = 0.0
+                return
+            self.accumulator -= self.step
+            self.tick()
+            ticks += 1
+
+    def tick(self):
+        """Run a single tick, moving the tetromino down when soft dropping."""
+        engine = self.engine
+        if self.soft_drop and engine.ticks % self.soft_drop_ticks == 0 and \
+                not engine.grounded:
+            engine.step(Action.DOWN)
+        engine.tick()
+
+    def get_offset(self):
+        """
+        Get how far the current tetromino has fallen towards the next row,
+        for rendering it between ticks.
+
+        Returns:
+            float: The fraction of a row the tetromino has fallen by.
+
+        """
+        engine = self.engine
+        if engine.game_over or engine.grounded:
+            return 0.0
+        return (engine.gravity_ticks + self.alpha) / engine.gravity
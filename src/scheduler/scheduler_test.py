@@ -0,0 +1,59 @@
+from src.engine.engine import Engine
+from src.scheduler.scheduler import Scheduler
+
+
+def test_fixed_rate():
+    e = Engine(seed=1)
+    s = Scheduler(e, rate=60)
+    # the number of ticks only depends on the elapsed time
+    for i in range(240):
+        s.update(1 / 240)
+    assert e.ticks in (59, 60)
+    e2 = Engine(seed=1)
+    s2 = Scheduler(e2, rate=60)
+    for i in range(30):
+        s2.update(1 / 30)
+    assert e2.ticks in (59, 60)
+
+
+def test_catch_up_cap():
+    e = Engine(seed=1)
+    s = Scheduler(e, rate=60, max_ticks=5)
+    s.update(1.0)
+    assert e.ticks == 5
+    assert s.alpha == 0.0
+    s.update(1 / 120)
+    assert e.ticks == 5
+    assert s.alpha == 0.5
+
+
+def test_soft_drop():
+    e = Engine(seed=1, gravity=1000)
+    s = Scheduler(e, soft_drop_ticks=2)
+    y = e.board.current_tetromino.origin.y
+    for i in range(4):
+        s.tick()
+    assert e.board.current_tetromino.origin.y == y
+    s.soft_drop = True
+    for i in range(4):
+        s.tick()
+    assert e.board.current_tetromino.origin.y == y - 2
+
+
+def test_offset():
+    e = Engine(seed=1, gravity=4)
+    s = Scheduler(e, rate=60)
+    assert s.get_offset() == 0.0
+    s.update(1.5 / 60)
+    assert e.ticks == 1
+    assert abs(s.get_offset() - 1.5 / 4) < 1e-9
+
+
+def test_game_over():
+    e = Engine(seed=1)
+    s = Scheduler(e, rate=60)
+    s.start()
+    e.game_over = True
+    s.update(1.0)
+    assert e.ticks == 0
+    assert s.accumulator == 0.0
@@ -0,0 +1,87 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.simulator.simulator import IDS, Simulator  # noqa: E402
+
+
+def test_init():
+    s = Simulator(8, seed=1)
+    assert s.boards.shape == (8, 22, 10)
+    assert not s.boards.any()
+    assert not s.game_over.any()
+    assert s.pieces.shape == (8,)
+
+
+def test_bags():
+    s = Simulator(4, seed=1)
+    pieces = [s.pieces]
+    for i in range(13):
+        s.step([[0, 0]] * 4)
+        pieces.append(s.pieces)
+    for game in np.array(pieces).T:
+        assert sorted(game[:7]) == list(range(7))
+        assert sorted(game[7:]) == list(range(7))
+
+
+def test_seed():
+    a = Simulator(16, seed=3)
+    b = Simulator(16, seed=3)
+    assert (a.pieces == b.pieces).all()
+
+
+def test_step_lines():
+    s = Simulator(2, seed=1)
+    i = IDS.index("I")
+    o = IDS.index("O")
+    for column in [0, 4]:
+        s.pieces = np.array([i, i])
+        s.step([[0, column], [1, column]])
+    s.pieces = np.array([o, o])
+    boards, lines_cleared, game_over = s.step([[0, 8], [0, 8]])
+    assert list(lines_cleared) == [1, 0]
+    assert not game_over.any()
+    # the first game has the top of the O left, the second has two vertical
+    # I and an O
+    assert boards[0, 0].tolist() == [False] * 8 + [True, True]
+    assert not boards[0, 1:].any()
+    assert boards[1, :4, 0].all()
+    assert boards[1, :4, 4].all()
+    assert boards[1, :2, 8:].all()
+    assert boards[1].sum() == 12
+
+
+def test_step_lines_drop():
+    s = Simulator(1, seed=1)
+    o = IDS.index("O")
+    for column in [0, 2, 4, 6]:
+        s.pieces = np.array([o])
+        s.step([[0, column]])
+    i = IDS.index("I")
+    s.pieces = np.array([i])
+    s.step([[1, 8]])
+    s.pieces = np.array([i])
+    boards, lines_cleared, game_over = s.step([[1, 9]])
+    assert lines_cleared[0] == 2
+    assert boards[0, 0].tolist() == [False] * 8 + [True, True]
+    assert boards[0, 1].tolist() == [False] * 8 + [True, True]
+    assert boards[0].sum() == 4
+
+
+def test_game_over():
+    s = Simulator(2, seed=1)
+    boards, lines_cleared, game_over = s.step([[0, -1], [0, 0]])
+    assert game_over.tolist() == [True, False]
+    assert not boards[0].any()
+    for i in range(30):
+        s.step([[1, 0], [1, 0]])
+    assert s.game_over.all()
+
+
+def test_column_heights():
+    s = Simulator(64, seed=2)
+    rng = np.random.default_rng(2)
+    for i in range(40):
+        s.step(np.stack([rng.integers(0, 4, 64), rng.integers(0, 8, 64)], 1))
+        # the heights kept up to date match the heights of the boards
+        assert (s.heights == s.get_column_heights()).all()
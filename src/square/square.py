@@ -1,21 +1,21 @@
 """Square object in the game."""
 import logging
 
-from src.renderer.renderer import Renderer
-
 log = logging.getLogger(__name__)
 
 
 class Square:
     """A square object represents four sided shape in the game."""
 
+    __slots__ = ("x", "y", "color")
+
     def __init__(self, point, color):
         """
         Initialize a Square object.
 
         Args:
             point (Point): The point representing the square's bottom left corner.
-            color (int list): The color to render the square in [R, G, B]
+            color (tuple int): The color to render the square in (R, G, B)
         """
         self.x = point.x
         self.y = point.y
@@ -32,7 +32,3 @@ class Square:
         self.x += x
         self.y += y
 
-    def render_square(self):
-        """Renders the square to the screen"""
-        r = Renderer(self.x, self.y, self.color)
-        r.draw()
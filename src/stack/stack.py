@@ -0,0 +1,114 @@
+"""Locked squares of the board."""
+from src.point.point import Point
+from src.square.square import Square
+
+
+class Stack:
+    """
+    A stack holds the squares locked on the board, bucketed by row.
+
+    Each row is a list of the (x, color) of its squares and a square's y
+    coordinate is the index of its row, so clearing lines removes whole rows
+    and the rows above drop by being re-indexed, without updating any
+    square.
+    """
+
+    def __init__(self, height):
+        """
+        Initialize a Stack object.
+
+        Args:
+            height (int): The number of rows of the board.
+        """
+        self.height = height
+        self.clear()
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """
+        Iterate over copies of the locked squares, from the bottom row up.
+
+        Returns:
+            iterator (Square): The locked squares.
+
+        """
+        for x, y, color in self.cells():
+            yield Square(Point(x, y), color)
+
+    def append(self, square):
+        """
+        Lock a square in its row.
+
+        Args:
+            square (Square): The square to be locked.
+        """
+        rows = self.rows
+        if square.y >= len(rows):
+            # Squares locked above the board at the end of a game
+            rows.extend([] for j in range(len(rows), square.y + 1))
+        rows[square.y].append((square.x, square.color))
+        self.count += 1
+
+    def cells(self):
+        """
+        Iterate over the locked squares without building square objects.
+
+        Returns:
+            iterator (tuple): The (x, y, color) of every locked square.
+
+        """
+        for y, row in enumerate(self.rows):
+            for x, color in row:
+                yield x, y, color
+
+    def clear(self):
+        """Remove every locked square."""
+        self.rows = [[] for j in range(self.height)]
+        self.count = 0
+
+    def snapshot(self):
+        """
+        Save the locked squares.
+
+        Returns:
+            tuple: The rows as tuples of the (x, color) of their squares.
+
+        """
+        return tuple(tuple(row) for row in self.rows)
+
+    def restore(self, snapshot):
+        """
+        Restore the locked squares saved by `snapshot`.
+
+        Args:
+            snapshot (tuple): The rows of locked squares.
+        """
+        self.rows = [list(row) for row in snapshot]
+        self.count = sum(len(row) for row in self.rows)
+
+    def clear_row(self, index):
+        """
+        Remove the squares of a row, leaving the row empty.
+
+        Args:
+            index (int): The index of the row.
+        """
+        self.count -= len(self.rows[index])
+        self.rows[index] = []
+
+    def remove_rows(self, indices):
+        """
+        Remove rows, dropping the rows above them.
+
+        Args:
+            indices (list int): The indices of the rows to be removed.
+        """
+        if not indices:
+            return
+        for index in sorted(indices, reverse=True):
+            self.count -= len(self.rows[index])
+            del self.rows[index]
+        while len(self.rows) < self.height:
+            self.rows.append([])
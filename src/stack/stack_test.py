@@ -0,0 +1,47 @@
+from src.colors import colors
+from src.point.point import Point
+from src.square.square import Square
+from src.stack.stack import Stack
+
+
+def get_stack(positions):
+    stack = Stack(22)
+    for x, y in positions:
+        stack.append(Square(Point(x, y), colors.ASH))
+    return stack
+
+
+def test_append():
+    stack = get_stack([(0, 0), (3, 1), (1, 0)])
+    assert len(stack) == 3
+    assert list(stack.cells()) == [
+        (0, 0, colors.ASH), (1, 0, colors.ASH), (3, 1, colors.ASH)]
+    assert [(s.x, s.y) for s in stack] == [(0, 0), (1, 0), (3, 1)]
+
+
+def test_append_above_height():
+    stack = get_stack([(4, 22), (4, 23)])
+    assert len(stack) == 2
+    assert [y for x, y, color in stack.cells()] == [22, 23]
+
+
+def test_clear_row():
+    stack = get_stack([(0, 0), (1, 0), (0, 1)])
+    stack.clear_row(0)
+    assert len(stack) == 1
+    assert [(s.x, s.y) for s in stack] == [(0, 1)]
+
+
+def test_remove_rows():
+    stack = get_stack([(0, 0), (0, 1), (1, 2), (2, 3), (3, 5)])
+    stack.remove_rows([1, 3])
+    assert len(stack) == 3
+    assert len(stack.rows) == 22
+    assert [(s.x, s.y) for s in stack] == [(0, 0), (1, 1), (3, 3)]
+
+
+def test_clear():
+    stack = get_stack([(0, 0), (0, 1)])
+    stack.clear()
+    assert len(stack) == 0
+    assert list(stack) == []
@@ -13,6 +13,10 @@ LAYOUTS = {
     'T': [Point(0, 0), Point(1, 0), Point(1, 1), Point(2, 0)]
 }
 
+# Tetromino identifiers, indexed by the numbers used in compact
+# representations of the game
+IDS = tuple(LAYOUTS)
+
 # Each tetromino's spawn location on the board
 SPAWN = {
     'O': Point(4, 20),
@@ -35,6 +39,51 @@ ROTATION_POINTS = {
     'T': Point(1.5, 0.5)
 }
 
+
+def _rotate_layout_cw(layout, rotation_point):
+    """
+    Rotate a layout by 90 degrees clockwise about the given point.
+
+    Args:
+        layout (list tuple): The squares' positions relative to the origin.
+        rotation_point (Point): The point of rotation relative to the origin.
+
+    Returns:
+        tuple: The rotated squares' positions relative to the origin.
+
+    """
+    rotated = []
+    for x, y in layout:
+        # the square's bottom right point, relative to the point of
+        # rotation, becomes the new square origin after the rotation
+        btm_right_x = x - rotation_point.x + 1
+        btm_right_y = y - rotation_point.y
+        rotated.append((int(btm_right_y + rotation_point.x),
+                        int(-btm_right_x + rotation_point.y)))
+    return tuple(rotated)
+
+
+def _get_rotations(id):
+    """
+    Compute a tetromino's layout in each of the four rotation states.
+
+    Args:
+        id (string): The identifier of the tetromino.
+
+    Returns:
+        tuple: The layouts indexed by rotation state value.
+
+    """
+    layouts = [tuple((p.x, p.y) for p in LAYOUTS[id])]
+    for i in range(3):
+        layouts.append(_rotate_layout_cw(layouts[-1], ROTATION_POINTS[id]))
+    return tuple(layouts)
+
+
+# Each tetromino's square's position relative to its origin, indexed by
+# rotation state value
+ROTATIONS = {id: _get_rotations(id) for id in LAYOUTS}
+
 # Wall kicks are based on the Super Rotation System (SRS)
 # http://tetris.wikia.com/wiki/SRS
 WALL_KICKS_CW = {
@@ -45,7 +94,7 @@ WALL_KICKS_CW = {
         [(0, 0), (+1, 0), (+1, +1), (0, -2), (+1, -2)],
         [(0, 0), (-1, 0), (-1, -1), (0, +2), (-1, +2)]
     ],
-    ('I'): [
+    ('I',): [
         [(0, 0), (-2, 0), (+1, 0), (-2, -1), (+1, +2)],
         [(0, 0), (-1, 0), (+2, 0), (-1, +2), (+2, -1)],
         [(0, 0), (+2, 0), (-1, 0), (+2, +1), (-1, -2)],
@@ -60,7 +109,7 @@ WALL_KICKS_CCW = {
         [(0, 0), (-1, 0), (-1, +1), (0, -2), (-1, -2)],
         [(0, 0), (-1, 0), (-1, -1), (0, +2), (-1, +2)]
     ],
-    ('I'): [
+    ('I',): [
         [(0, 0), (-1, 0), (+2, 0), (-1, +2), (+2, -1)],
         [(0, 0), (+2, 0), (-1, 0), (+2, +1), (-1, -2)],
         [(0, 0), (+1, 0), (-2, 0), (+1, -2), (-2, +1)],
@@ -68,6 +117,31 @@ WALL_KICKS_CCW = {
     ]
 }
 
+# Rotation directions, matching the change in rotation state value
+CW = 1
+CCW = -1
+
+
+def _get_wall_kicks():
+    """
+    Index the wall kick tests by tetromino, initial state and direction.
+
+    Returns:
+        dict: The wall kick offsets keyed by (id, initial state value,
+        direction).
+
+    """
+    wall_kicks = {}
+    for direction, table in ((CW, WALL_KICKS_CW), (CCW, WALL_KICKS_CCW)):
+        for ids, tests in table.items():
+            for id in ids:
+                for state, offsets in enumerate(tests):
+                    wall_kicks[(id, state, direction)] = tuple(offsets)
+    return wall_kicks
+
+
+WALL_KICKS = _get_wall_kicks()
+
 # Color values in RGB
 COLORS = {
     'O': colors.YELLOW,
@@ -3,7 +3,7 @@ import logging
 
 from src.point.point import Point
 from src.square.square import Square
-from src.tetromino.constants import LAYOUTS, ROTATION_POINTS, SPAWN
+from src.tetromino.constants import ROTATIONS, SPAWN
 from src.tetromino.state import State
 
 log = logging.getLogger(__name__)
@@ -12,6 +12,8 @@ log = logging.getLogger(__name__)
 class Tetromino:
     """A tetromino is a piece which consists of exactly four squares."""
 
+    __slots__ = ("id", "origin", "color", "squares", "state")
+
     def __init__(self, id, origin, color):
         """
         Initialize a Tetromino object.
@@ -19,15 +21,15 @@ class Tetromino:
         Args:
             id (string): The identifier of the tetromino (O, I, J, L, S, Z, T)
             origin (Point): The position of the bottom left point used as a reference for the "LAYOUTS" values
-            color (list): The color of the tetromino in [R, G, B] format
+            color (tuple): The color of the tetromino in (R, G, B) format
         """
-        log.info("Initializing Tetromino (id={}, origin=[{}][{}], color={})".format(
-            id, origin.x, origin.y, color))
+        log.debug("Initializing Tetromino (id=%s, origin=[%s][%s], color=%s)",
+                  id, origin.x, origin.y, color)
         self.id = id
         self.origin = origin
         self.color = color
-        self.squares = self.get_squares()
         self.state = State.ZERO
+        self.squares = self.get_squares()
 
     def get_squares(self):
         """
@@ -38,9 +40,9 @@ class Tetromino:
 
         """
         squares = []
-        for i in range(4):
-            square_position = self.origin.add(LAYOUTS[self.id][i])
-            squares.append(Square(square_position, self.color))
+        for x, y in ROTATIONS[self.id][self.state.value]:
+            squares.append(
+                Square(Point(self.origin.x + x, self.origin.y + y), self.color))
         return squares
 
     def offset(self, x, y):
@@ -51,52 +53,30 @@ class Tetromino:
             x (int): The number of horizontal units to move (pos = right, neg = left).
             y (int): The number of vertical units to move (pos = up, neg = down).
         """
-        self.origin = self.origin.add(Point(x, y))
+        self.origin = Point(self.origin.x + x, self.origin.y + y)
         for square in self.squares:
             square.offset(x, y)
 
     def rotate_cw(self):
         """Rotate the tetromino by 90 degrees, clockwise."""
-        # the point of rotation, relative to the board origin
-        abs_rotation_pt = self.origin.add(ROTATION_POINTS[self.id])
-        for i in range(len(self.squares)):
-            # the square's position relative to the point of rotation
-            current_square = Point(
-                self.squares[i].x, self.squares[i].y).subtract(abs_rotation_pt)
-            # the square's bottom right point, which will be the new
-            # square origin after the rotation
-            btm_right = current_square.add(Point(1, 0))
-            # x -> y and y -> -x for rotation about the origin
-            new_point = Point(btm_right.y, -btm_right.x).add(abs_rotation_pt)
-            # replace the old square with the new square
-            point = Point(int(new_point.x), int(new_point.y))
-            self.squares[i] = Square(point, self.color)
         self.state = self.state.next()
+        self.update_squares()
 
     def rotate_ccw(self):
         """Rotate the tetromino by 90 degrees, counterclockwise."""
-        # the point of rotation, relative to the board origin
-        abs_rotation_pt = self.origin.add(ROTATION_POINTS[self.id])
-        for i in range(len(self.squares)):
-            # the square's position relative to the point of rotation
-            current_square = Point(
-                self.squares[i].x, self.squares[i].y).subtract(abs_rotation_pt)
-            # the square's bottom right point, which will be the new
-            # square origin after the rotation
-            top_left = current_square.add(Point(0, 1))
-            # x -> y and y -> -x for rotation about the origin
-            new_point = Point(-top_left.y, top_left.x).add(abs_rotation_pt)
-            # replace the old square with the new square
-            point = Point(int(new_point.x), int(new_point.y))
-            self.squares[i] = Square(point, self.color)
         self.state = self.state.prev()
+        self.update_squares()
+
+    def update_squares(self):
+        """Move the squares to the layout of the current rotation state."""
+        layout = ROTATIONS[self.id][self.state.value]
+        for square, (x, y) in zip(self.squares, layout):
+            square.x = self.origin.x + x
+            square.y = self.origin.y + y
 
     def reset_position(self):
-        """Reset the tetromino to its original spawn position."""
+        """Reset the tetromino to its original spawn position and rotation."""
         self.origin = SPAWN[self.id]
+        self.state = State.ZERO
         self.squares = self.get_squares()
 
-    def render_tetromino(self):
-        """Render the tetromino to the screen."""
-        for square in self.squares:
-            square.render_square()
@@ -2,7 +2,7 @@ import operator
 
 from src.colors import colors
 from src.point.point import Point
-from src.tetromino.constants import COLORS
+from src.tetromino.constants import COLORS, SPAWN
 from src.tetromino.tetromino import State, Tetromino
 
 
@@ -143,6 +143,21 @@ def test_rotate_ccw():
                     t.rotate_ccw()
 
 
+def test_reset_position():
+    for id, layouts in expected_new_layouts.items():
+        t = Tetromino(id, Point(1, 1), COLORS[id])
+        t.rotate_cw()
+        t.reset_position()
+        assert t.state == State.ZERO
+        assert (t.origin.x, t.origin.y) == (SPAWN[id].x, SPAWN[id].y)
+        squares_tuples = get_list_tuples(t.squares)
+        layout_offset = []
+        for l in layouts[0]:
+            layout_offset.append(
+                tuple(map(operator.add, l, (SPAWN[id].x, SPAWN[id].y))))
+        assert sorted(squares_tuples) == sorted(layout_offset)
+
+
 def get_list_tuples(tetromino_squares):
     result = []
     for square in tetromino_squares:
@@ -0,0 +1,101 @@
+"""Game event tracing."""
+import time
+from collections import namedtuple
+from enum import Enum
+
+# A recorded event, whose arguments depend on its kind:
+#   SPAWN (id, x, y)           a tetromino became the current tetromino
+#   MOVE (dx, dy)              the current tetromino moved
+#   ROTATE (direction, kick)   the current tetromino rotated with the index of
+#                              the wall kick test that passed, -1 if all failed
+#   LOCK (id, x, y)            the current tetromino was locked at its origin
+#   CLEAR (lines,)             filled lines were cleared
+#   HOLD (id, held id)         the current tetromino was put on hold
+TraceEvent = namedtuple("TraceEvent", ["time", "event", "args"])
+
+
+class Event(Enum):
+    """Event is the kind of a traced game event."""
+
+    SPAWN = 0
+    MOVE = 1
+    ROTATE = 2
+    LOCK = 3
+    CLEAR = 4
+    HOLD = 5
+
+
+class Tracer:
+    """
+    Tracer records game events in a ring buffer, keeping the most recent ones.
+
+    Callers check `enabled` before recording, so a disabled tracer only costs
+    an attribute lookup and nothing is built or formatted.
+    """
+
+    def __init__(self, size=4096):
+        """
+        Initialize a Tracer object.
+
+        Args:
+            size (int): The number of events kept.
+        """
+        self.clock = time.perf_counter
+        self.enabled = False
+        self.size = size
+        self.clear()
+
+    def __len__(self):
+        return min(self.count, self.size)
+
+    def enable(self):
+        """Start recording events."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording events."""
+        self.enabled = False
+
+    def clear(self):
+        """Remove every recorded event."""
+        self.buffer = [None] * self.size
+        self.count = 0
+
+    def record(self, event, *args):
+        """
+        Record an event.
+
+        Args:
+            event (Event): The kind of the event.
+            *args: The arguments of the event.
+        """
+        self.buffer[self.count % self.size] = (self.clock(), event, args)
+        self.count += 1
+
+    def get_events(self):
+        """
+        Get the recorded events.
+
+        Returns:
+            list (TraceEvent): The kept events from oldest to newest.
+
+        """
+        start = max(0, self.count - self.size)
+        return [TraceEvent(*self.buffer[i % self.size])
+                for i in range(start, self.count)]
+
+    def dump(self, f):
+        """
+        Write the recorded events as text, one event per line.
+
+        Args:
+            f (file): The file the events are written to.
+        """
+        for event in self.get_events():
+            f.write("{:.6f}\t{}\t{}\n".format(
+                event.time, event.event.name,
+                "\t".join(str(arg) for arg in event.args)))
+
+
+# The tracer of the game's events, disabled unless tracing is configured
+tracer = Tracer()
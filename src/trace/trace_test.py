@@ -0,0 +1,51 @@
+import io
+
+from src.engine.action import Action
+from src.engine.engine import Engine
+from src.tetromino.constants import CW
+from src.trace.trace import Event, Tracer, tracer
+
+
+def test_ring_buffer():
+    t = Tracer(size=3)
+    for i in range(5):
+        t.record(Event.CLEAR, i)
+    assert len(t) == 3
+    assert [e.args for e in t.get_events()] == [(2,), (3,), (4,)]
+    t.clear()
+    assert t.get_events() == []
+
+
+def test_dump():
+    t = Tracer()
+    t.clock = lambda: 1.5
+    t.record(Event.ROTATE, CW, 2)
+    f = io.StringIO()
+    t.dump(f)
+    assert f.getvalue() == "1.500000\tROTATE\t1\t2\n"
+
+
+def test_engine_events():
+    tracer.clear()
+    Engine(seed=1).step(Action.LEFT)
+    assert len(tracer) == 0
+
+    tracer.enable()
+    try:
+        engine = Engine(seed=1)
+        first = engine.board.current_tetromino.id
+        engine.step(Action.LEFT)
+        engine.step(Action.ROTATE_CW)
+        engine.step(Action.HOLD)
+        engine.step(Action.HARD_DROP)
+    finally:
+        tracer.disable()
+    events = tracer.get_events()
+    tracer.clear()
+    assert [e.event for e in events] == [
+        Event.SPAWN, Event.MOVE, Event.ROTATE, Event.HOLD, Event.SPAWN,
+        Event.LOCK, Event.SPAWN]
+    assert events[0].args[0] == first
+    assert events[1].args == (-1, 0)
+    assert events[2].args == (CW, 0)
+    assert events[3].args == (first, None)
@@ -0,0 +1,52 @@
+"""The state of the last frame drawn to the window."""
+
+
+class Frame:
+    """
+    Frame remembers what the last frame drawn showed, to tell whether the
+    window needs to be drawn again.
+
+    A frame is stale when the board changed, the current tetromino fell
+    further towards the next row or a redraw was requested since it was
+    drawn. Ticks that change neither, such as the ones spent waiting for
+    the lock delay, leave it as it is.
+    """
+
+    def __init__(self, board, scheduler):
+        """
+        Initialize a Frame object.
+
+        Args:
+            board (Board): The board being drawn.
+            scheduler (Scheduler): Gives the offset the current tetromino
+                is drawn at.
+        """
+        self.board = board
+        self.scheduler = scheduler
+        self.version = None
+        self.offset = None
+        self.redraw = True
+
+    @property
+    def stale(self):
+        """
+        Determine whether the last frame no longer matches the game.
+
+        Returns:
+            bool: True if the frame needs to be drawn again, False
+            otherwise.
+
+        """
+        return self.redraw or self.board.version != self.version or \
+            self.scheduler.get_offset() != self.offset
+
+    def drawn(self, offset):
+        """
+        Record that a frame was drawn for the current state of the board.
+
+        Args:
+            offset (float): The offset the current tetromino was drawn at.
+        """
+        self.version = self.board.version
+        self.offset = offset
+        self.redraw = False
@@ -0,0 +1,44 @@
+from src.engine.action import Action
+from src.engine.engine import Engine
+from src.scheduler.scheduler import Scheduler
+from src.window.frame import Frame
+
+
+def grounded_engine():
+    e = Engine(seed=1)
+    while not e.grounded:
+        e.step(Action.DOWN)
+    return e
+
+
+def test_redraw():
+    e = Engine(seed=1)
+    f = Frame(e.board, Scheduler(e))
+    assert f.stale
+    f.drawn(f.scheduler.get_offset())
+    assert not f.stale
+    f.redraw = True
+    assert f.stale
+
+
+def test_tick_without_change():
+    e = grounded_engine()
+    s = Scheduler(e)
+    f = Frame(e.board, s)
+    f.drawn(s.get_offset())
+    # ticks spent waiting for the lock delay don't change what is drawn
+    s.update(s.step)
+    assert e.lock_ticks == 1
+    assert not f.stale
+
+
+def test_tick_with_change():
+    e = Engine(seed=1)
+    s = Scheduler(e)
+    f = Frame(e.board, s)
+    f.drawn(s.get_offset())
+    s.update(s.step)
+    assert f.stale
+    f.drawn(s.get_offset())
+    e.step(Action.LEFT)
+    assert f.stale
@@ -1,12 +1,19 @@
 """The game's window."""
 import logging
+import random
 
-from pyglet.window import Window
+import pyglet
+from pyglet.window import Window, key
 
 from src import config
-from src.board.board import Board
+from src.bot.bot import Bot
+from src.engine.engine import Engine
 from src.keyboard.keyboard import Keyboard
-from src.movement.movement import Movement
+from src.profiler.profiler import Profiler
+from src.replay.replay import Recorder
+from src.scheduler.scheduler import Scheduler
+from src.renderer.renderer import Renderer
+from src.window.frame import Frame
 
 log = logging.getLogger(__name__)
 
@@ -16,13 +23,103 @@ class Window(Window):
 
     def __init__(self, *args, **kwargs):
         """Initialize a Window object."""
-        log.info("Initializing window {}".format(args))
+        log.info("Initializing window %s", args)
         super().__init__(*args, **kwargs)
-        self.board = Board(int(self.width / config.UNIT),
-                           int(self.height / config.UNIT))
-        self.keyboard = Keyboard(Movement(self.board))
-        self.on_key_press = self.keyboard.on_key_press
+        seed = random.getrandbits(64)
+        self.engine = Engine(int(self.width / config.UNIT),
+                             int(self.height / config.UNIT), seed)
+        self.recorder = Recorder(self.engine, seed)
+        self.board = self.engine.board
+        self.profiler = Profiler()
+        self.renderer = Renderer(self.board, self.profiler)
+        self.overlay = None
+        self.scheduler = Scheduler(
+            self.engine, getattr(config, "TICK_RATE", 60))
+        self.frame = Frame(self.board, self.scheduler)
+        self.drawn = False
+        self.keyboard = Keyboard(self.engine, Bot(), self.profiler,
+                                 self.scheduler)
+        self.scheduler.start()
+
+    @property
+    def invalid(self):
+        """
+        Determine whether the window needs to be redrawn, which pyglet's
+        event loop checks before dispatching on_draw.
+
+        Returns:
+            bool: True if the board changed or the current tetromino fell
+            further since the last frame or a redraw was requested, False
+            otherwise.
+
+        """
+        return self.frame.stale
+
+    @invalid.setter
+    def invalid(self, value):
+        self.frame.redraw = value
+
+    def on_resize(self, width, height):
+        """Override the pyglet on_resize function to request a redraw."""
+        self.frame.redraw = True
+        return super().on_resize(width, height)
+
+    def on_expose(self):
+        """Override the pyglet on_expose function to request a redraw."""
+        self.frame.redraw = True
+
+    def on_key_press(self, symbol, modifier):
+        """
+        Override the pyglet on_key_press function to toggle the profiler's
+        overlay with F3 and export its samples with F12, passing the other
+        keys to the keyboard.
+        """
+        if symbol == key.F3:
+            self.toggle_overlay()
+        elif symbol == key.F12:
+            self.profiler.export(
+                getattr(config, "PROFILE_CSV", "profile.csv"))
+        else:
+            self.keyboard.on_key_press(symbol, modifier)
+
+    def on_key_release(self, symbol, modifier):
+        """Override the pyglet on_key_release function."""
+        self.keyboard.on_key_release(symbol, modifier)
+
+    def toggle_overlay(self):
+        """Show or hide the frame time and input latency overlay."""
+        if self.overlay is None:
+            self.overlay = pyglet.text.Label(
+                font_name="Courier New", font_size=10, multiline=True,
+                width=self.width, x=4, y=self.height - 4, anchor_y="top")
+        else:
+            self.overlay = None
+        self.frame.redraw = True
 
     def on_draw(self):
-        """Override the pyglet on_draw function."""
-        self.board.render_board()
+        """
+        Override the pyglet on_draw function, skipping the frame when
+        nothing changed since the last one. pyglet 1.x draws every window
+        after any scheduled function ran, whether it is invalid or not.
+        """
+        self.drawn = self.frame.stale
+        if not self.drawn:
+            return
+        start = self.profiler.clock()
+        offset = self.scheduler.get_offset()
+        self.renderer.draw(offset)
+        if self.overlay is not None:
+            self.overlay.text = self.profiler.get_text()
+            self.overlay.draw()
+        self.profiler.add("frame", self.profiler.clock() - start)
+        self.frame.drawn(offset)
+
+    def flip(self):
+        """
+        Override the pyglet flip function to time the presented frame,
+        keeping the last frame on screen when on_draw skipped drawing.
+        """
+        if not self.drawn:
+            return
+        super().flip()
+        self.profiler.present()